@@ -7,15 +7,26 @@ through its governance API. It keeps track of processed articles in a SQLite
 database to avoid duplicates.
 """
 
+import asyncio
+import atexit
+import io
 import os
 import json
+import re
 import sqlite3
 import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+from xml.etree import ElementTree
 
+import aiohttp
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dateutil.parser import parse as parse_date
 from pythonjsonlogger import jsonlogger
 import logging
@@ -40,6 +51,135 @@ logging.getLogger().addHandler(json_handler)
 
 logger = logging.getLogger("rss_curator")
 
+# Upper bound on concurrent feed downloads per cycle
+MAX_FETCH_WORKERS = 16
+FETCH_TIMEOUT_SECONDS = 30
+
+# Feed parsing is CPU/allocation heavy; keep the worker count small
+MAX_PARSE_WORKERS = min(4, os.cpu_count() or 1)
+
+# Element names (namespace stripped) of a single article in RSS and Atom
+FEED_ITEM_TAGS = ('item', 'entry')
+
+# Default cap on entries considered per feed (override with "max_items")
+DEFAULT_MAX_ITEMS = 50
+
+# Stay well below SQLite's bound-parameter limit in IN (...) queries
+SQLITE_MAX_IN_PARAMS = 500
+
+# Basic HTML stripping for article descriptions
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Common US timezone abbreviations dateutil cannot resolve on its own
+_TZINFOS = {
+    'EST': -5 * 3600, 'EDT': -4 * 3600,
+    'CST': -6 * 3600, 'CDT': -5 * 3600,
+    'MST': -7 * 3600, 'MDT': -6 * 3600,
+    'PST': -8 * 3600, 'PDT': -7 * 3600,
+}
+
+def _parse_published(published: str) -> datetime:
+    """Parse a feed timestamp, trying the cheap stdlib parsers first.
+    
+    RSS uses RFC 822 dates and Atom uses ISO 8601; dateutil is only used
+    for anything that matches neither.
+    """
+    try:
+        return parsedate_to_datetime(published)
+    except (TypeError, ValueError):
+        pass
+    
+    try:
+        return datetime.fromisoformat(published.replace('Z', '+00:00'))
+    except ValueError:
+        pass
+    
+    return parse_date(published, tzinfos=_TZINFOS)
+
+class FetchedFeed(NamedTuple):
+    """Result of a conditional feed download."""
+    body: Optional[bytes]  # None when the server answered 304 Not Modified
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+class FeedParseError(Exception):
+    """Raised when feedparser cannot make sense of a feed body."""
+
+def _is_recent(article: Dict[str, Any], max_age_days: int, now: datetime) -> bool:
+    """Check if an article is within the maximum age limit."""
+    try:
+        published = article.get('published', article.get('updated'))
+        if not published:
+            return True  # If no date found, assume it's recent
+        
+        pub_date = _parse_published(published)
+        if not pub_date.tzinfo:
+            pub_date = pub_date.replace(tzinfo=timezone.utc)
+        
+        age = now - pub_date
+        return age.days <= max_age_days
+        
+    except Exception as e:
+        logger.warning("Failed to parse article date",
+                       extra={"error": str(e), "article_title": article.get('title')})
+        return True  # Assume recent on error
+
+def _iter_entries(body: bytes, max_age_days: int, max_items: int, now: datetime) -> Iterator[Dict[str, Any]]:
+    """Stream entries out of a feed body one item at a time.
+    
+    Each ``<item>``/``<entry>`` element is handed to feedparser on its own
+    and freed right after, so the full feed is never built in memory.
+    Feeds are published newest first, so iteration stops at the first
+    entry older than ``max_age_days`` or after ``max_items`` entries.
+    
+    Raises:
+        ElementTree.ParseError: If the body is not well-formed XML
+    """
+    if max_items <= 0:
+        return
+    
+    count = 0
+    for _, element in ElementTree.iterparse(io.BytesIO(body), events=('end',)):
+        if element.tag.rsplit('}', 1)[-1] not in FEED_ITEM_TAGS:
+            continue
+        
+        parsed = feedparser.parse(ElementTree.tostring(element))
+        element.clear()
+        if not parsed.entries:
+            continue
+        
+        entry = parsed.entries[0]
+        if not _is_recent(entry, max_age_days, now):
+            break
+        yield entry
+        
+        count += 1
+        if count >= max_items:
+            break
+
+def parse_feed_body(body: bytes, max_age_days: int, max_items: int, now: datetime) -> List[Dict[str, Any]]:
+    """Extract the recent entries of a downloaded feed.
+    
+    Module-level so it can run in a worker process. Falls back to a full,
+    lenient feedparser pass for feeds that are not well-formed XML.
+    
+    Returns:
+        At most ``max_items`` entries
+    
+    Raises:
+        FeedParseError: If the feed could not be parsed
+    """
+    try:
+        return list(_iter_entries(body, max_age_days, max_items, now))
+    except ElementTree.ParseError:
+        pass
+    
+    feed = feedparser.parse(body)
+    if feed.bozo:  # feedparser encountered an error
+        raise FeedParseError(str(feed.bozo_exception))
+    return feed.entries[:max_items]
+
 class RSSCurator:
     def __init__(self, config_path: str = "config.json", db_path: Optional[str] = None):
         """Initialize the RSS Curator agent.
@@ -55,8 +195,34 @@ class RSSCurator:
         if not self.api_token:
             raise ValueError(f"Missing required environment variable: {self.config['api_token_env_var']}")
         
+        self.session = self._create_session()
+        
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        atexit.register(self.conn.close)
+        self._pending_inserts: List[tuple] = []
+        self._cycle_now: Optional[datetime] = None
         self._init_database()
     
+    def _create_session(self) -> requests.Session:
+        """Create a keep-alive HTTP session for the governance API.
+        
+        Connection failures and transient server errors are retried with
+        backoff. POST is not in urllib3's idempotent method set, so a proposal
+        that reached the server is never re-sent on an error status.
+        """
+        retry = Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({
+            'Authorization': f'Bearer {self.api_token}',
+            'Content-Type': 'application/json'
+        })
+        return session
+    
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load and validate the configuration file."""
         try:
@@ -68,92 +234,179 @@ class RSSCurator:
                 if key not in config:
                     raise ValueError(f"Missing required config key: {key}")
             
+            # Keywords are matched case-insensitively; lowercase them once here
+            for feed in config['feeds']:
+                feed['_keywords_lower'] = tuple(k.lower() for k in feed.get('keywords', []))
+            
             return config
             
         except Exception as e:
-            logger.error("Failed to load config", 
-                        error=str(e),
-                        config_path=config_path)
+            logger.error("Failed to load config",
+                         extra={"error": str(e), "config_path": config_path})
             raise
     
     def _init_database(self) -> None:
         """Initialize the SQLite database for tracking processed articles."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA temp_store=MEMORY")
+            self.conn.execute("PRAGMA cache_size=-64000")
+            
+            with self.conn:
+                # sqlite3 does not open a transaction implicitly for DDL, so
+                # begin one explicitly to keep the migration all-or-nothing
+                self.conn.execute("BEGIN IMMEDIATE")
+                tables = dict(self.conn.execute(
+                    "SELECT name, sql FROM sqlite_master WHERE type = 'table' "
+                    "AND name IN ('processed_articles', 'processed_articles_old')"
+                ).fetchall())
+                
+                # Databases created before the table was keyed directly on guid
+                # are migrated once to the WITHOUT ROWID layout. A leftover
+                # processed_articles_old comes from an interrupted migration.
+                current = tables.get('processed_articles')
+                needs_migration = current is not None and 'WITHOUT ROWID' not in current.upper()
+                leftover = 'processed_articles_old' in tables
+                if needs_migration or leftover:
+                    logger.info("Migrating processed_articles to WITHOUT ROWID: %s", self.db_path)
+                if needs_migration and leftover:
+                    self.conn.execute("""
+                        INSERT INTO processed_articles_old (guid, feed_name, title, processed_at)
+                        SELECT guid, feed_name, title, processed_at FROM processed_articles
+                    """)
+                    self.conn.execute("DROP TABLE processed_articles")
+                elif needs_migration:
+                    self.conn.execute("ALTER TABLE processed_articles RENAME TO processed_articles_old")
+                
+                self.conn.execute("""
                     CREATE TABLE IF NOT EXISTS processed_articles (
                         guid TEXT PRIMARY KEY,
                         feed_name TEXT NOT NULL,
                         title TEXT NOT NULL,
                         processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
+                    ) WITHOUT ROWID
                 """)
-                conn.commit()
                 
+                if needs_migration or leftover:
+                    self.conn.execute("""
+                        INSERT OR IGNORE INTO processed_articles (guid, feed_name, title, processed_at)
+                        SELECT guid, feed_name, title, processed_at FROM processed_articles_old
+                        WHERE guid IS NOT NULL
+                    """)
+                    self.conn.execute("DROP TABLE processed_articles_old")
+                
+                # HTTP validators of the last fully processed download per feed
+                self.conn.execute("""
+                    CREATE TABLE IF NOT EXISTS feeds_state (
+                        url TEXT PRIMARY KEY,
+                        etag TEXT,
+                        last_modified TEXT
+                    ) WITHOUT ROWID
+                """)
+            
         except Exception as e:
             logger.error("Failed to initialize database",
-                        error=str(e),
-                        db_path=self.db_path)
+                         extra={"error": str(e), "db_path": self.db_path})
             raise
     
-    def _is_article_processed(self, guid: str) -> bool:
-        """Check if an article has already been processed."""
+    def _load_validators(self, urls: List[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """Load the stored (etag, last_modified) pair for each known feed URL."""
+        validators = {}
+        try:
+            for start in range(0, len(urls), SQLITE_MAX_IN_PARAMS):
+                chunk = urls[start:start + SQLITE_MAX_IN_PARAMS]
+                placeholders = ', '.join('?' * len(chunk))
+                cursor = self.conn.execute(
+                    f"SELECT url, etag, last_modified FROM feeds_state WHERE url IN ({placeholders})",
+                    chunk
+                )
+                validators.update((url, (etag, modified)) for url, etag, modified in cursor)
+        except Exception as e:
+            logger.error("Failed to load feed validators",
+                         extra={"error": str(e)})
+        return validators
+    
+    def _save_validators(self, url: str, fetched: FetchedFeed) -> None:
+        """Remember the validators of a download whose articles were all handled."""
+        if fetched.body is None:
+            return
+        
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO feeds_state (url, etag, last_modified) VALUES (?, ?, ?)",
+                    (url, fetched.etag, fetched.last_modified)
+                )
+        except Exception as e:
+            logger.error("Failed to save feed validators",
+                         extra={"error": str(e), "url": url})
+    
+    def _filter_unseen(self, guids: List[str]) -> Set[str]:
+        """Return the subset of ``guids`` that has not been processed yet.
+        
+        Looks up the whole batch with ``WHERE guid IN (...)`` queries instead
+        of one query per article.
+        """
+        unseen = set(guids)
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    "SELECT 1 FROM processed_articles WHERE guid = ?",
-                    (guid,)
+            for start in range(0, len(guids), SQLITE_MAX_IN_PARAMS):
+                chunk = guids[start:start + SQLITE_MAX_IN_PARAMS]
+                placeholders = ', '.join('?' * len(chunk))
+                cursor = self.conn.execute(
+                    f"SELECT guid FROM processed_articles WHERE guid IN ({placeholders})",
+                    chunk
                 )
-                return cursor.fetchone() is not None
+                unseen.difference_update(row[0] for row in cursor)
+            return unseen
         except Exception as e:
             logger.error("Failed to check article status",
-                        error=str(e),
-                        guid=guid)
-            return True  # Assume processed on error to avoid duplicates
+                         extra={"error": str(e), "guid_count": len(guids)})
+            return set()  # Assume processed on error to avoid duplicates
     
     def _mark_article_processed(self, article: Dict[str, Any], feed_name: str) -> None:
-        """Mark an article as processed in the database."""
+        """Queue an article to be marked as processed on the next flush."""
+        guid = article.get('id', article.get('guid', article.get('link')))
+        if guid is None:
+            return  # Nothing to key on; the table does not accept NULL guids
+        
+        self._pending_inserts.append(
+            (guid, feed_name, article.get('title', 'Unknown Title'))
+        )
+    
+    def _flush_inserts(self) -> None:
+        """Write all queued processed articles in a single transaction."""
+        if not self._pending_inserts:
+            return
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
+            with self.conn:
+                self.conn.executemany(
                     """
-                    INSERT INTO processed_articles (guid, feed_name, title)
+                    INSERT OR IGNORE INTO processed_articles (guid, feed_name, title)
                     VALUES (?, ?, ?)
                     """,
-                    (article.get('id', article.get('guid', article.get('link'))),
-                     feed_name,
-                     article.get('title', 'Unknown Title'))
+                    self._pending_inserts
                 )
-                conn.commit()
         except Exception as e:
-            logger.error("Failed to mark article as processed",
-                        error=str(e),
-                        article_title=article.get('title'))
+            logger.error("Failed to mark articles as processed",
+                         extra={"error": str(e), "article_count": len(self._pending_inserts)})
+        finally:
+            self._pending_inserts.clear()
     
-    def _contains_keywords(self, text: str, keywords: List[str]) -> bool:
-        """Check if text contains any of the keywords (case insensitive)."""
+    def _contains_keywords(self, text: str, keywords_lower: Tuple[str, ...]) -> bool:
+        """Check if text contains any of the keywords (case insensitive).
+        
+        Args:
+            text: Text to search
+            keywords_lower: Keywords, already lowercased
+        """
         text_lower = text.lower()
-        return any(keyword.lower() in text_lower for keyword in keywords)
+        return any(keyword in text_lower for keyword in keywords_lower)
     
     def _is_article_recent(self, article: Dict[str, Any], max_age_days: int) -> bool:
         """Check if an article is within the maximum age limit."""
-        try:
-            published = article.get('published', article.get('updated'))
-            if not published:
-                return True  # If no date found, assume it's recent
-            
-            pub_date = parse_date(published)
-            if not pub_date.tzinfo:
-                pub_date = pub_date.replace(tzinfo=timezone.utc)
-            
-            age = datetime.now(timezone.utc) - pub_date
-            return age.days <= max_age_days
-            
-        except Exception as e:
-            logger.warning("Failed to parse article date",
-                         error=str(e),
-                         article_title=article.get('title'))
-            return True  # Assume recent on error
+        return _is_recent(article, max_age_days, self._cycle_now or datetime.now(timezone.utc))
     
     def _prepare_shortlist_payload(self, article: Dict[str, Any], feed_name: str) -> Dict[str, Any]:
         """Prepare the payload for the shortlist proposal API."""
@@ -162,8 +415,7 @@ class RSSCurator:
         # Get article description (prefer summary over description)
         description = article.get('summary', article.get('description', 'No description available'))
         if '<' in description:  # Basic HTML stripping
-            description = ' '.join(part for part in description.split('<') 
-                                if '>' in part for text in part.split('>'))[1]
+            description = _WS_RE.sub(' ', _TAG_RE.sub(' ', description)).strip()
         
         content = template['content'].format(
             feed_name=feed_name,
@@ -185,57 +437,80 @@ class RSSCurator:
         try:
             payload = self._prepare_shortlist_payload(article, feed_name)
             
-            response = requests.post(
+            response = self.session.post(
                 self.config['api_endpoint'],
-                json=payload,
-                headers={
-                    'Authorization': f'Bearer {self.api_token}',
-                    'Content-Type': 'application/json'
-                }
+                json=payload
             )
             
             if response.status_code in (200, 201):
                 logger.info("Successfully proposed article",
-                          article_title=article.get('title'),
-                          feed_name=feed_name)
+                            extra={"article_title": article.get('title'), "feed_name": feed_name})
                 return True
             else:
                 logger.error("Failed to propose article",
-                           article_title=article.get('title'),
-                           status_code=response.status_code,
-                           response_text=response.text)
+                             extra={"article_title": article.get('title'),
+                                    "status_code": response.status_code,
+                                    "response_text": response.text})
                 return False
                 
         except Exception as e:
             logger.error("Error proposing article",
-                        error=str(e),
-                        article_title=article.get('title'))
+                         extra={"error": str(e), "article_title": article.get('title')})
             return False
     
-    def process_feed(self, feed_config: Dict[str, Any]) -> int:
-        """Process a single RSS feed and propose relevant articles.
+    async def _fetch_all(self, urls: List[str]) -> List[Union[FetchedFeed, BaseException]]:
+        """Download all feed bodies concurrently.
+        
+        Requests are conditional on the validators stored for each feed, so
+        unchanged feeds cost a 304 response without a body. Only the network
+        I/O is overlapped; parsing is left to the caller.
         
         Returns:
-            Number of articles successfully proposed
+            Downloads in the same order as ``urls``. Failed downloads are
+            returned as the raised exception instead.
+        """
+        validators = self._load_validators(urls)
+        timeout = aiohttp.ClientTimeout(total=FETCH_TIMEOUT_SECONDS)
+        connector = aiohttp.TCPConnector(limit=MAX_FETCH_WORKERS)
+        
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            async def fetch(url: str) -> FetchedFeed:
+                etag, last_modified = validators.get(url, (None, None))
+                headers = {}
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+                
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304:
+                        return FetchedFeed(None, etag, last_modified)
+                    response.raise_for_status()
+                    return FetchedFeed(await response.read(),
+                                       response.headers.get('ETag'),
+                                       response.headers.get('Last-Modified'))
+            
+            return await asyncio.gather(*(fetch(url) for url in urls),
+                                        return_exceptions=True)
+    
+    def _filter_and_propose(self, entries: List[Dict[str, Any]], feed_config: Dict[str, Any]) -> Tuple[int, bool]:
+        """Filter parsed feed entries and propose relevant articles.
+        
+        Returns:
+            Number of articles successfully proposed, and whether every
+            entry was handled (no proposal failed and no error was raised)
         """
         proposed_count = 0
-        logger.info("Processing feed", feed_name=feed_config['name'])
+        all_handled = True
         
         try:
-            feed = feedparser.parse(feed_config['url'])
-            
-            if feed.bozo:  # feedparser encountered an error
-                logger.error("Feed parsing error",
-                           feed_name=feed_config['name'],
-                           error=str(feed.bozo_exception))
-                return 0
+            # Get unique identifier for each article and look them up in one go
+            guids = [entry.get('id', entry.get('guid', entry.get('link'))) for entry in entries]
+            unseen = self._filter_unseen(guids)
             
-            for entry in feed.entries:
-                # Get unique identifier for the article
-                guid = entry.get('id', entry.get('guid', entry.get('link')))
-                
+            for entry, guid in zip(entries, guids):
                 # Skip if already processed
-                if self._is_article_processed(guid):
+                if guid not in unseen:
                     continue
                 
                 # Check if article matches criteria
@@ -243,40 +518,141 @@ class RSSCurator:
                 description = entry.get('summary', entry.get('description', ''))
                 combined_text = f"{title}\n{description}"
                 
-                if (self._contains_keywords(combined_text, feed_config['keywords']) and
+                if (self._contains_keywords(combined_text, feed_config['_keywords_lower']) and
                     self._is_article_recent(entry, feed_config.get('max_age_days', 7))):
                     
                     if self.propose_to_shortlist(entry, feed_config['name']):
                         self._mark_article_processed(entry, feed_config['name'])
+                        unseen.discard(guid)
                         proposed_count += 1
+                    else:
+                        all_handled = False
                         
             logger.info("Feed processing complete",
-                       feed_name=feed_config['name'],
-                       articles_proposed=proposed_count)
+                        extra={"feed_name": feed_config['name'], "articles_proposed": proposed_count})
             
-            return proposed_count
+            return proposed_count, all_handled
             
         except Exception as e:
             logger.error("Error processing feed",
-                        feed_name=feed_config['name'],
-                        error=str(e))
-            return 0
+                         extra={"feed_name": feed_config['name'], "error": str(e)})
+            return proposed_count, False
+        finally:
+            self._flush_inserts()
+    
+    def _parse_args(self, feed_configs: List[Dict[str, Any]]) -> tuple:
+        """Arguments for parse_feed_body after the body.
+        
+        When several configs share a feed URL, the loosest age and item
+        limits are used so every config still sees all entries it accepts.
+        """
+        return (max(c.get('max_age_days', 7) for c in feed_configs),
+                max(c.get('max_items', DEFAULT_MAX_ITEMS) for c in feed_configs),
+                self._cycle_now or datetime.now(timezone.utc))
+    
+    def _propose_parsed(self, feed_config: Dict[str, Any], parse: Callable[[], List[Dict[str, Any]]]) -> Tuple[int, bool]:
+        """Run a feed's parse step and propose relevant articles from the result.
+        
+        Returns:
+            Number of articles successfully proposed, and whether the feed was
+            fully handled; only then may its download be skipped next time
+        """
+        logger.info("Processing feed", extra={"feed_name": feed_config['name']})
+        
+        try:
+            entries = parse()
+        except FeedParseError as e:
+            logger.error("Feed parsing error",
+                         extra={"feed_name": feed_config['name'], "error": str(e)})
+            return 0, False
+        except Exception as e:
+            logger.error("Error processing feed",
+                         extra={"feed_name": feed_config['name'], "error": str(e)})
+            return 0, False
+        
+        return self._filter_and_propose(entries, feed_config)
+    
+    def process_feed(self, feed_config: Dict[str, Any]) -> int:
+        """Process a single RSS feed and propose relevant articles.
+        
+        Returns:
+            Number of articles successfully proposed
+        """
+        fetched = asyncio.run(self._fetch_all([feed_config['url']]))[0]
+        
+        def parse() -> List[Dict[str, Any]]:
+            if isinstance(fetched, BaseException):
+                raise fetched
+            if fetched.body is None:
+                return []  # Not modified since the last processed download
+            return parse_feed_body(fetched.body, *self._parse_args([feed_config]))
+        
+        proposed, handled = self._propose_parsed(feed_config, parse)
+        if handled:
+            self._save_validators(feed_config['url'], fetched)
+        return proposed
     
     def run_once(self) -> int:
         """Process all configured feeds once.
         
+        Each distinct feed URL is downloaded once, concurrently and
+        conditionally (feeds unchanged since their last fully processed
+        download are skipped), and parsed on a small process pool; the
+        entries are then filtered for every config that uses the URL.
+        Filtering, database access and proposals stay on the calling thread,
+        one feed config at a time.
+        
         Returns:
             Total number of articles proposed
         """
         total_proposed = 0
         logger.info("Starting feed processing cycle")
         
+        # Configs with different keyword filters may share the same source
+        configs_by_url: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         for feed_config in self.config['feeds']:
-            proposed = self.process_feed(feed_config)
-            total_proposed += proposed
+            configs_by_url[feed_config['url']].append(feed_config)
+        
+        urls = list(configs_by_url)
+        downloads = asyncio.run(self._fetch_all(urls)) if urls else []
+        
+        # Article ages are measured against a single timestamp per cycle
+        self._cycle_now = datetime.now(timezone.utc)
+        
+        jobs = []
+        with ProcessPoolExecutor(max_workers=MAX_PARSE_WORKERS) as pool:
+            for url, fetched in zip(urls, downloads):
+                feed_configs = configs_by_url[url]
+                if isinstance(fetched, BaseException):
+                    for feed_config in feed_configs:
+                        logger.error("Error processing feed",
+                                     extra={"feed_name": feed_config['name'], "error": str(fetched)})
+                    continue
+                
+                if fetched.body is None:
+                    logger.info("Feed not modified, skipping: %s", url)
+                    continue
+                
+                future = pool.submit(parse_feed_body, fetched.body, *self._parse_args(feed_configs))
+                jobs.append((url, fetched, feed_configs, future))
+            
+            for url, fetched, feed_configs, future in jobs:
+                all_handled = True
+                for feed_config in feed_configs:
+                    max_items = feed_config.get('max_items', DEFAULT_MAX_ITEMS)
+                    proposed, handled = self._propose_parsed(
+                        feed_config, lambda: future.result()[:max_items])
+                    total_proposed += proposed
+                    all_handled = all_handled and handled
+                
+                # Only skip this download next time if nothing is left to retry
+                if all_handled:
+                    self._save_validators(url, fetched)
+        
+        self._cycle_now = None
         
         logger.info("Feed processing cycle complete",
-                   total_proposed=total_proposed)
+                    extra={"total_proposed": total_proposed})
         return total_proposed
     
     def run_forever(self) -> None:
@@ -288,14 +664,14 @@ class RSSCurator:
             try:
                 self.run_once()
                 logger.info("Sleeping until next check",
-                          check_interval_seconds=check_interval)
+                            extra={"check_interval_seconds": check_interval})
                 time.sleep(check_interval)
             except KeyboardInterrupt:
                 logger.info("Received shutdown signal")
                 break
             except Exception as e:
                 logger.error("Error in main loop",
-                           error=str(e))
+                             extra={"error": str(e)})
                 time.sleep(60)  # Wait a minute before retrying
 
 def main():
@@ -307,7 +683,7 @@ def main():
         logger.info("RSS Curator agent stopped")
     except Exception as e:
         logger.error("Fatal error",
-                    error=str(e))
+                     extra={"error": str(e)})
         raise
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 
 import json
 import os
+from html import escape
+from string import Template
 
 # Get the absolute path of the directory where the script is located
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -9,17 +11,8 @@ script_dir = os.path.dirname(os.path.abspath(__file__))
 json_file_path = os.path.join(script_dir, 'shortlist.json')
 html_file_path = os.path.join(script_dir, 'index.html')
 
-try:
-    # Read data from shortlist.json
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    items = data.get('items', [])
-
-    # Generate HTML list items
-    list_items_html = ''.join([f'<li>{item}</li>' for item in items])
-
-    # HTML structure with embedded CSS
-    html_content = f'''
+# HTML structure with embedded CSS
+PAGE_TEMPLATE = Template('''
 <!DOCTYPE html>
 <html lang="it">
 <head>
@@ -27,11 +20,11 @@ try:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Shortlist</title>
     <style>
-        body {{ font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif; background-color: #f0f2f5; color: #333; margin: 0; padding: 20px; display: flex; justify-content: center; align-items: center; min-height: 90vh; }}
-        .container {{ background: #fff; padding: 30px 40px; border-radius: 10px; box-shadow: 0 4px 12px rgba(0,0,0,0.15); max-width: 700px; width: 90%; }}
-        h1 {{ color: #1c1e21; text-align: center; font-size: 2.5em; }}
-        ol {{ list-style: none; counter-reset: list-counter; padding: 0; }}
-        li {{
+        body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif; background-color: #f0f2f5; color: #333; margin: 0; padding: 20px; display: flex; justify-content: center; align-items: center; min-height: 90vh; }
+        .container { background: #fff; padding: 30px 40px; border-radius: 10px; box-shadow: 0 4px 12px rgba(0,0,0,0.15); max-width: 700px; width: 90%; }
+        h1 { color: #1c1e21; text-align: center; font-size: 2.5em; }
+        ol { list-style: none; counter-reset: list-counter; padding: 0; }
+        li {
             counter-increment: list-counter;
             margin-bottom: 15px;
             padding: 20px;
@@ -41,8 +34,8 @@ try:
             font-size: 1.2em;
             display: flex;
             align-items: center;
-        }}
-        li::before {{
+        }
+        li::before {
             content: counter(list-counter);
             font-weight: 700;
             font-size: 1.5em;
@@ -50,19 +43,30 @@ try:
             margin-right: 20px;
             min-width: 30px;
             text-align: right;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="container">
         <h1>Shortlist</h1>
         <ol>
-            {list_items_html}
+            $list_items_html
         </ol>
     </div>
 </body>
 </html>
-'''
+''')
+
+try:
+    # Read data from shortlist.json
+    with open(json_file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    items = data.get('items', [])
+
+    # Generate HTML list items
+    list_items_html = ''.join(f'<li>{escape(str(item))}</li>' for item in items)
+
+    html_content = PAGE_TEMPLATE.substitute(list_items_html=list_items_html)
 
     # Write the generated HTML to index.html
     with open(html_file_path, 'w', encoding='utf-8') as f:
@@ -1,18 +1,25 @@
-import json
 import os
 import uuid
+import functools
+import hashlib
 import time
 import subprocess
+import logging
 import random
-import psutil
+import threading
+import orjson
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from utils.logging_config import configure_logging
-from utils.logging_utils import ComponentLogger, NODE_CONTEXT, log_execution_time, log_state_change
+from utils.claim_store import ClaimStore
+from utils.logging_utils import ComponentLogger, NODE_CONTEXT, log_execution_time, log_operation, log_state_change
 
-# Simple decorator for logging operations
+# Simple decorator for logging failed DockerManager operations; timed,
+# structured operation logs use the log_operation context manager
 def log_operation_decorator(func):
+    @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         operation_name = func.__name__
         try:
@@ -24,9 +31,6 @@ def log_operation_decorator(func):
             raise
     return wrapper
 
-# Use the decorator as log_operation for backward compatibility
-log_operation = log_operation_decorator
-
 # Import regional coordination (optional - graceful fallback if not available)
 try:
     from utils.geographic import get_geographic_manager
@@ -35,17 +39,52 @@ try:
 except ImportError:
     REGIONAL_SUPPORT = False
 
+# libgit2 bindings (optional - falls back to the git CLI if not available)
+try:
+    import pygit2
+    PYGIT2_SUPPORT = True
+except ImportError:
+    PYGIT2_SUPPORT = False
+
+# Docker SDK (optional - falls back to the docker CLI if not available)
+try:
+    import docker
+    DOCKER_SDK_SUPPORT = True
+except ImportError:
+    DOCKER_SDK_SUPPORT = False
+
+# Filesystem notifications for the idle wait (optional - falls back to sleeping)
+try:
+    import watchfiles
+    WATCHFILES_SUPPORT = True
+except ImportError:
+    WATCHFILES_SUPPORT = False
+
 # --- Configuration ---
-NODE_ID_FILE = f".node_id_{os.getpid()}"
+# Per-process by default so several nodes can share a checkout; point
+# SHORTLIST_NODE_ID_FILE at a stable path to keep one identity across restarts
+NODE_ID_FILE = os.getenv("SHORTLIST_NODE_ID_FILE", f".node_id_{os.getpid()}")
 ROSTER_FILE = "roster.json"
 SCHEDULE_FILE = "schedule.json"
 ASSIGNMENTS_FILE = "assignments.json"
 
 HEARTBEAT_INTERVAL = timedelta(minutes=5)
-TASK_HEARTBEAT_INTERVAL = timedelta(seconds=1) # Run more heartbeats in testing
+ROSTER_RETRY_MAX_BACKOFF = timedelta(seconds=60) # Longest wait before retrying a failed roster heartbeat
+# Each task heartbeat is a pull, a commit and a push; nine fit in TASK_EXPIRATION
+TASK_HEARTBEAT_INTERVAL = timedelta(seconds=10)
 TASK_EXPIRATION = timedelta(seconds=90) # A task is orphaned if its heartbeat is older than 90s
+TASK_EXPIRATION_MS = int(TASK_EXPIRATION.total_seconds() * 1000)
+# A task whose heartbeats keep failing is given up this long before it could be taken over
+TASK_HEARTBEAT_GIVE_UP = TASK_EXPIRATION - 2 * TASK_HEARTBEAT_INTERVAL
 IDLE_PULL_INTERVAL = timedelta(seconds=30)
+IDLE_SYNC_INTERVAL = timedelta(seconds=10) # Background pull cadence while idle
 JITTER_MILLISECONDS = 5000
+SSH_CONTROL_PERSIST = "10m" # How long an idle shared SSH connection to the git remote stays open
+MAX_CLAIM_ATTEMPTS = 5 # Pushes to try before a contended claim gives up
+
+# Optional SQLite claim database shared by nodes on the same host. When set,
+# local nodes arbitrate claims atomically and skip the jitter delay.
+CLAIM_DB_FILE = os.getenv("SHORTLIST_CLAIM_DB")
 
 # Health check configuration
 HEALTH_CHECK_INTERVAL = timedelta(seconds=20)  # Check health every 20 seconds
@@ -70,7 +109,7 @@ RENDERER_CONFIG = {
             "{repo_root}/output:/app/data",
             "{repo_root}/secrets:/app/data/secrets:rw"
         ],
-        "env_vars": ["MAINTAINER_API_TOKEN", "CONTRIBUTOR_API_TOKEN", "GIT_AUTH_TOKEN"]
+        "env_vars": ["MAINTAINER_API_TOKEN", "CONTRIBUTOR_API_TOKEN", "GIT_AUTH_TOKEN", "GITHUB_REPO"]
     },
     "admin_ui": {
         "image": "shortlist-admin-ui",
@@ -134,6 +173,8 @@ RENDERER_CONFIG = {
 
 # Configure logging
 configure_logging('node', log_level="INFO")
+# Shared by module-level helpers and the timing decorators
+node_logger = ComponentLogger('node').logger
 
 # --- State Machine States ---
 class NodeState:
@@ -142,10 +183,53 @@ class NodeState:
     ACTIVE = "ACTIVE"
 
 # --- Docker Management ---
+# Renderer images built by this process: image tag -> build context hash
+_built_images: Dict[str, str] = {}
+
+# Content digests of build context files: path -> ((st_mtime_ns, st_size), digest)
+_file_digests: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+
+def _file_digest(file_path: str) -> Tuple[int, bytes]:
+    """Return a file's size and content digest, rereading it only when it changed."""
+    stat = os.stat(file_path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _file_digests.get(file_path)
+    if cached and cached[0] == key:
+        return stat.st_size, cached[1]
+
+    with open(file_path, 'rb') as f:
+        # Key on the file actually read, in case it was replaced since the stat
+        stat = os.fstat(f.fileno())
+        digest = hashlib.blake2b(f.read(), digest_size=16).digest()
+    _file_digests[file_path] = ((stat.st_mtime_ns, stat.st_size), digest)
+    return stat.st_size, digest
+
+def hash_build_context(path: str) -> str:
+    """Hash the relative paths and contents of every file under ``path``.
+
+    Each file contributes its length-prefixed relative path, its size and a
+    digest of its contents, so no two different trees share an input. The
+    per-file digests are cached on (mtime_ns, size); only changed files are
+    read again.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            file_path = os.path.join(root, name)
+            rel_path = os.path.relpath(file_path, path).encode()
+            size, file_digest = _file_digest(file_path)
+            digest.update(len(rel_path).to_bytes(8, 'little'))
+            digest.update(rel_path)
+            digest.update(size.to_bytes(8, 'little'))
+            digest.update(file_digest)
+    return digest.hexdigest()
+
 class DockerManager:
     """Manages Docker container lifecycle and health checks for renderers."""
     
-    def __init__(self, task_type: str, task_id: str, node_id: str, logger: Any) -> None:
+    def __init__(self, task_type: str, task_id: str, node_id: str, logger: Any,
+                 client: Optional[Any] = None) -> None:
         """Initialize Docker manager for a renderer.
         
         Args:
@@ -153,53 +237,87 @@ class DockerManager:
             task_id: Unique task ID
             node_id: ID of the managing node
             logger: Logger instance for structured logging
+            client: Shared docker SDK client; the docker CLI is used if None
         """
         self.task_type = task_type
         self.task_id = task_id
         self.node_id = node_id
         self.logger = logger
+        self.client = client
+        self.container = None
         self.container_id = None
+        self.started_at = None
+        self.events = None
+        self.exit_waiter = None
         self.health_check_failures = 0
+        # Health probes run on a worker thread; each check collects the previous one
+        self.health_executor: Optional[ThreadPoolExecutor] = None
+        self.health_probe: Optional[Future] = None
+        self.health_session = None
         
         # Get renderer config
-        self.config = RENDERER_CONFIG.get(task_type, {})
-        if not self.config:
+        config = RENDERER_CONFIG.get(task_type, {})
+        if not config:
             raise ValueError(f"No configuration found for renderer type: {task_type}")
         
         # Prepare container name
         self.container_name = f"{task_id}-{node_id[:8]}"
         
-        # Replace {repo_root} in volume mappings
-        repo_root = os.path.abspath(".")
-        self.config['volumes'] = [
-            v.replace("{repo_root}", repo_root) for v in self.config.get('volumes', [])
-        ]
+        # Replace {repo_root} in volume mappings, on a copy so the shared
+        # RENDERER_CONFIG keeps its templates
+        self.repo_root = os.getcwd()
+        self.config = {
+            **config,
+            'volumes': [v.replace("{repo_root}", self.repo_root) for v in config.get('volumes', [])]
+        }
     
-    @log_operation
+    @log_operation_decorator
     def build_image(self) -> None:
         """Build Docker image for the renderer."""
         renderer_path = f"renderers/{self.task_type}"
         if not os.path.exists(renderer_path):
             raise FileNotFoundError(f"Renderer path not found: {renderer_path}")
         
-        run_command(['docker', 'build', '-t', self.config['image'], renderer_path])
+        # Skip the build entirely if this process already built the same context
+        image = self.config['image']
+        context_hash = hash_build_context(renderer_path)
+        if _built_images.get(image) == context_hash:
+            self.logger.info("Renderer image up to date, skipping build", image=image)
+            return
+
+        if self.client:
+            # Consume the build log as it streams; images.build() would keep all of it
+            for chunk in self.client.api.build(path=renderer_path, tag=image, rm=True, decode=True):
+                if 'error' in chunk:
+                    raise docker.errors.BuildError(chunk['error'], [])
+        else:
+            run_command(['docker', 'build', '-t', image, renderer_path], capture_stdout=False)
+        _built_images[image] = context_hash
     
-    @log_operation
+    @log_operation_decorator
     def start_container(self) -> str:
         """Start the renderer container.
         
         Returns:
             str: Container ID
         """
-        command = ['docker', 'run', '-d', '--name', self.container_name]
+        try:
+            return self._run_container()
+        except Exception:
+            # The image may have been removed since it was built: rebuild next time
+            _built_images.pop(self.config['image'], None)
+            raise
+
+    def _run_container(self) -> str:
+        environment = {}
 
         # Inject environment variables from OS env or secrets file
         try:
-            secrets_path = os.path.join(os.path.abspath('.'), 'secrets', 'secrets.json')
+            secrets_path = os.path.join(self.repo_root, 'secrets', 'secrets.json')
             secrets = {}
             if os.path.exists(secrets_path):
-                with open(secrets_path, 'r') as f:
-                    secrets = json.load(f) if f else {}
+                with open(secrets_path, 'rb') as f:
+                    secrets = orjson.loads(f.read())
         except Exception:
             secrets = {}
 
@@ -209,11 +327,28 @@ class DockerManager:
             if not val:
                 val = secrets.get(var)
             if val:
-                command.extend(['-e', f'{var}={val}'])
+                environment[var] = val
             else:
                 self.logger.warning("Missing optional environment variable for renderer",
                                     variable=var, task_type=self.task_type)
         
+        if self.client:
+            self.started_at = int(time.time())
+            self.container = self.client.containers.run(
+                self.config['image'],
+                detach=True,
+                name=self.container_name,
+                environment=environment,
+                ports={'8000/tcp': self.config['port']} if 'port' in self.config else None,
+                volumes=self.config.get('volumes', []),
+            )
+            self.container_id = self.container.id
+            return self.container_id
+
+        command = ['docker', 'run', '-d', '--name', self.container_name]
+        for var, val in environment.items():
+            command.extend(['-e', f'{var}={val}'])
+        
         # Add port mapping if configured
         if 'port' in self.config:
             command.extend(['-p', f"{self.config['port']}:8000"])
@@ -222,31 +357,79 @@ class DockerManager:
         for volume in self.config.get('volumes', []):
             command.extend(['-v', volume])
         
-        # Add environment variables for API
-        if self.task_type == 'api':
-            for env_var in ['GIT_AUTH_TOKEN', 'GITHUB_REPO', 'MAINTAINER_API_TOKEN', 'CONTRIBUTOR_API_TOKEN']:
-                value = os.getenv(env_var)
-                if value:
-                    command.extend(['-e', f"{env_var}={value}"])
-        
         # Start container
         command.append(self.config['image'])
         result = run_command(command)
         self.container_id = result.strip()
         return self.container_id
     
+    def watch_exit(self, on_exit: threading.Event) -> None:
+        """Set ``on_exit`` as soon as the container dies.
+
+        With the SDK client, subscribes to the daemon's event stream, replaying
+        from the container start so an early exit is not missed. With the CLI,
+        a single ``docker wait`` process blocks for the container's lifetime.
+        Either way the wait runs on a daemon thread.
+        """
+        if not self.container:
+            if self.container_id:
+                self._wait_for_exit_cli(on_exit)
+            return
+
+        self.events = self.client.events(
+            since=self.started_at,
+            filters={'container': self.container_id, 'event': 'die'},
+            decode=True
+        )
+
+        def wait_for_exit():
+            try:
+                for _ in self.events:
+                    self.logger.warning("Container stopped unexpectedly",
+                                    container_id=self.container_id[:12])
+                    on_exit.set()
+                    return
+            except Exception:
+                pass  # Stream closed by stop_container
+
+        threading.Thread(target=wait_for_exit, name=f"docker-events-{self.task_id}",
+                         daemon=True).start()
+
+    def _wait_for_exit_cli(self, on_exit: threading.Event) -> None:
+        container_id = self.container_id
+        waiter = self.exit_waiter = subprocess.Popen(['docker', 'wait', container_id],
+                                                     stdout=subprocess.DEVNULL,
+                                                     stderr=subprocess.DEVNULL)
+
+        def wait_for_exit():
+            # A negative return code means stop_container killed the waiter
+            if waiter.wait() >= 0:
+                self.logger.warning("Container stopped unexpectedly",
+                                container_id=container_id[:12])
+                on_exit.set()
+
+        threading.Thread(target=wait_for_exit, name=f"docker-wait-{self.task_id}",
+                         daemon=True).start()
+
     def is_running(self) -> bool:
         """Check if the container is still running."""
         if not self.container_id:
             return False
         
+        if self.container:
+            try:
+                self.container.reload()
+                return self.container.status == 'running'
+            except docker.errors.DockerException:
+                return False
+
         try:
             result = run_command(['docker', 'ps', '-q', '--filter', f'id={self.container_id}'])
             return bool(result.strip())
         except Exception:
             return False
     
-    @log_operation
+    @log_operation_decorator
     def check_health(self) -> bool:
         """Perform health check if supported.
         
@@ -259,12 +442,26 @@ class DockerManager:
         if not self.is_running():
             return False
         
-        try:
+        if self.health_executor is None:
             import requests
-            port = self.config['port']
-            url = f"http://localhost:{port}/health"
-            
-            response = requests.get(url, timeout=HEALTH_CHECK_TIMEOUT)
+            # Keep-alive session: probes reuse one connection to the renderer
+            self.health_session = requests.Session()
+            self.health_executor = ThreadPoolExecutor(max_workers=1,
+                                                      thread_name_prefix=f"health-{self.task_id}")
+        
+        # A probe still in flight does not block the monitoring loop
+        if self.health_probe is not None and not self.health_probe.done():
+            return self.health_check_failures < MAX_HEALTH_CHECK_FAILURES
+        
+        probe, port = self.health_probe, self.config['port']
+        self.health_probe = self.health_executor.submit(
+            self.health_session.get, f"http://localhost:{port}/health",
+            timeout=HEALTH_CHECK_TIMEOUT)
+        if probe is None:
+            return True
+        
+        try:
+            response = probe.result()
             
             if response.status_code == 200:
                 self.health_check_failures = 0
@@ -287,79 +484,417 @@ class DockerManager:
         
         return self.health_check_failures < MAX_HEALTH_CHECK_FAILURES
     
-    @log_operation
+    @log_operation_decorator
     def stop_container(self) -> None:
         """Stop and remove the container."""
+        if self.events:
+            # Our own stop is not an unexpected exit
+            self.events.close()
+            self.events = None
+        if self.exit_waiter:
+            self.exit_waiter.kill()
+            self.exit_waiter = None
+        if self.health_executor:
+            self.health_executor.shutdown(wait=False, cancel_futures=True)
+            self.health_session.close()
+            self.health_executor = None
+            self.health_probe = None
+
         if self.container_id:
             try:
-                run_command(['docker', 'stop', self.container_id], suppress_errors=True)
-                run_command(['docker', 'rm', self.container_id], suppress_errors=True)
+                if self.container:
+                    self.container.stop()
+                    self.container.remove()
+                else:
+                    run_command(['docker', 'stop', self.container_id], suppress_errors=True, capture_stdout=False)
+                    run_command(['docker', 'rm', self.container_id], suppress_errors=True, capture_stdout=False)
             except Exception as e:
                 self.logger.error("Failed to stop container",
                                error=str(e),
                                error_type=type(e).__name__,
                                container_id=self.container_id)
             finally:
+                self.container = None
                 self.container_id = None
 
 # --- Git Operations ---
-def run_command(command: list[str], suppress_errors: bool = False) -> str:
-    logger = ComponentLogger('node').logger
+def run_command(command: list[str], suppress_errors: bool = False, capture_stdout: bool = True) -> str:
+    """Run a command, raising CalledProcessError on failure.
+
+    With ``capture_stdout=False`` the output is discarded at the OS level
+    instead of being piped into memory; only stderr is kept for error logs.
+    """
     cmd_str = ' '.join(command)
     
-    with log_operation(logger, 'command_execution', command=cmd_str):
+    # Per-command start/finish records are debug detail; at the default
+    # level only failures are logged
+    if node_logger.logger.isEnabledFor(logging.DEBUG):
+        with log_operation(node_logger, 'command_execution', command=cmd_str):
+            return _run_command(command, cmd_str, suppress_errors, capture_stdout)
+    return _run_command(command, cmd_str, suppress_errors, capture_stdout)
+
+def _run_command(command: list[str], cmd_str: str, suppress_errors: bool, capture_stdout: bool) -> str:
+    try:
+        result = subprocess.run(command, check=True, text=True, encoding='utf-8',
+                                stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+                                stderr=subprocess.PIPE)
+        return result.stdout.strip() if capture_stdout else ''
+    except subprocess.CalledProcessError as e:
+        if not suppress_errors:
+            node_logger.error("Command execution failed",
+                              command=cmd_str,
+                              stderr=e.stderr,
+                              exit_code=e.returncode)
+        raise
+
+# Serializes git operations between the main loop and the background threads
+_git_lock = threading.RLock()
+
+_repo = None
+
+def get_repo():
+    """Return the libgit2 handle for the working copy, opened once per process."""
+    global _repo
+    if _repo is None:
+        _repo = pygit2.Repository(os.getcwd())
+    return _repo
+
+_partial_clone = None
+
+def in_process_checkout() -> bool:
+    """Whether working-tree updates can run through libgit2.
+
+    libgit2 cannot fetch missing objects on demand, so in a partial (e.g.
+    blobless) clone checkouts, fast-forwards and hard resets have to go
+    through the git CLI, which lazily fetches the blobs they need.
+    """
+    global _partial_clone
+    if not PYGIT2_SUPPORT:
+        return False
+    if _partial_clone is None:
+        config = get_repo().config
+        _partial_clone = 'extensions.partialclone' in config or any(
+            entry.name.startswith('remote.') and entry.name.endswith('.promisor')
+            and entry.value == 'true'
+            for entry in config
+        )
+    return not _partial_clone
+
+def current_branch() -> Optional[str]:
+    """Return the checked-out branch name, or None if HEAD is detached."""
+    if not PYGIT2_SUPPORT:
         try:
-            result = subprocess.run(command, check=True, text=True, capture_output=True, encoding='utf-8')
-            return result.stdout.strip()
-        except subprocess.CalledProcessError as e:
-            if not suppress_errors:
-                logger.error("Command execution failed",
-                            command=cmd_str,
-                            stderr=e.stderr,
-                            exit_code=e.returncode)
-            raise
+            branch = run_command(['git', 'rev-parse', '--abbrev-ref', 'HEAD'], suppress_errors=True)
+        except subprocess.CalledProcessError:
+            return None
+        return branch if branch and branch != 'HEAD' else None
+
+    repo = get_repo()
+    if repo.head_is_detached or repo.head_is_unborn:
+        return None
+    return repo.head.shorthand
+
+def enable_ssh_connection_reuse() -> None:
+    """Let git's ssh transport share one connection across pulls and pushes.
+
+    Sets GIT_SSH_COMMAND to an OpenSSH ControlMaster configuration for this
+    process and its children, so only the first git command pays the SSH
+    handshake. Left alone if the operator already configured an ssh command.
+    """
+    if 'GIT_SSH_COMMAND' in os.environ or 'GIT_SSH' in os.environ:
+        return
+    configured = subprocess.run(['git', 'config', '--get', 'core.sshCommand'],
+                                capture_output=True).returncode == 0
+    if configured:
+        return
+    os.environ['GIT_SSH_COMMAND'] = (
+        "ssh -o ControlMaster=auto -o ControlPath=/tmp/shortlist-ssh-%C "
+        f"-o ControlPersist={SSH_CONTROL_PERSIST}"
+    )
 
 def git_pull():
-    run_command(['git', 'pull'])
+    """Bring the branch up to date with its upstream.
+
+    With pygit2 only the fetch shells out (for the host's credentials); the
+    fast-forward that almost every pull amounts to happens in-process. A
+    diverged branch still goes through ``git merge``.
+    """
+    with _git_lock:
+        if not in_process_checkout():
+            run_command(['git', 'pull'], capture_stdout=False)
+            return
+
+        run_command(['git', 'fetch', '--quiet'], capture_stdout=False)
+        repo = get_repo()
+        upstream = repo.revparse_single('@{upstream}').peel(pygit2.Commit)
+        analysis, _ = repo.merge_analysis(upstream.id)
+        if analysis & pygit2.GIT_MERGE_ANALYSIS_UP_TO_DATE:
+            return
+        if analysis & pygit2.GIT_MERGE_ANALYSIS_FASTFORWARD:
+            repo.checkout_tree(upstream, strategy=pygit2.GIT_CHECKOUT_SAFE)
+            repo.head.set_target(upstream.id)
+            return
+        run_command(['git', 'merge', '--quiet', '--no-edit', '@{upstream}'], capture_stdout=False)
+
+def git_fetch():
+    with _git_lock:
+        run_command(['git', 'fetch', '--quiet'], capture_stdout=False)
 
 def git_push():
-    run_command(['git', 'push'])
+    with _git_lock:
+        run_command(['git', 'push'], capture_stdout=False)
+
+def git_reset_hard(revision: str) -> None:
+    """Reset the branch, index and working tree to ``revision``, in-process when possible."""
+    with _git_lock:
+        if not in_process_checkout():
+            run_command(['git', 'reset', '--hard', revision], capture_stdout=False)
+            return
+
+        repo = get_repo()
+        repo.reset(repo.revparse_single(revision).peel(pygit2.Commit).id, pygit2.GIT_RESET_HARD)
+
+def git_reset_to_upstream() -> None:
+    """Abandon an unfinished merge and reset the branch to its upstream.
+
+    Recovers from a failed pull, which can leave conflict markers in the
+    state files. Local commits are discarded.
+    """
+    with _git_lock:
+        try:
+            run_command(['git', 'merge', '--abort'], suppress_errors=True, capture_stdout=False)
+        except subprocess.CalledProcessError:
+            pass  # No merge in progress
+        git_reset_hard('@{upstream}')
+
+def git_is_at(revision: str) -> bool:
+    """Return True if HEAD is ``revision`` and no tracked file differs from it.
+
+    A reset to ``revision`` would then change nothing. Untracked files are
+    ignored, as ``git reset --hard`` leaves them alone too.
+    """
+    with _git_lock:
+        if not in_process_checkout():
+            ahead_behind = run_command(['git', 'rev-list', '--count', '--left-right', f'HEAD...{revision}'])
+            if ahead_behind.split() != ['0', '0']:
+                return False
+            try:
+                run_command(['git', 'diff-index', '--quiet', 'HEAD', '--'], suppress_errors=True)
+            except subprocess.CalledProcessError as e:
+                if e.returncode == 1:
+                    return False
+                raise
+            return True
+
+        repo = get_repo()
+        if repo.head.target != repo.revparse_single(revision).peel(pygit2.Commit).id:
+            return False
+        untracked = pygit2.GIT_STATUS_WT_NEW | pygit2.GIT_STATUS_IGNORED
+        return all(flags & ~untracked == 0 for flags in repo.status().values())
 
 def commit_and_push(files, message):
-    run_command(['git', 'add'] + files)
-    status_result = run_command(['git', 'status', '--porcelain'])
-    if any(file in status_result for file in files):
-        run_command(['git', 'commit', '-m', message])
+    with _git_lock:
+        return _commit_and_push(files, message)
+
+def _commit_and_push(files, message):
+    if not PYGIT2_SUPPORT:
+        # --only stages and commits just these paths in a single git process;
+        # an unchanged set exits 1 with "nothing to commit" and no stderr
+        try:
+            run_command(['git', 'commit', '--quiet', '--only', '-m', message, '--'] + files,
+                        suppress_errors=True)
+        except subprocess.CalledProcessError as e:
+            if e.returncode == 1 and not e.stderr:
+                return False
+            node_logger.error("Command execution failed",
+                              command='git commit',
+                              stderr=e.stderr,
+                              exit_code=e.returncode)
+            raise
         git_push()
         return True
-    return False
+
+    # Stage and commit in-process; only the push needs the git CLI, which
+    # picks up the host's credential helpers and SSH configuration
+    repo = get_repo()
+    index = repo.index
+    index.read()
+    for path in files:
+        index.add(path)
+    index.write()
+
+    tree_id = index.write_tree()
+    if repo.head_is_unborn:
+        parents = []
+    elif tree_id == repo.head.peel(pygit2.Commit).tree.id:
+        return False
+    else:
+        parents = [repo.head.target]
+
+    signature = repo.default_signature
+    repo.create_commit('HEAD', signature, signature, message, tree_id, parents)
+    git_push()
+    return True
 
 # --- State Management ---
 def get_node_id():
-    if os.path.exists(NODE_ID_FILE):
+    try:
+        with open(NODE_ID_FILE, 'r') as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        pass
+
+    id_dir = os.path.dirname(NODE_ID_FILE)
+    if id_dir:
+        os.makedirs(id_dir, exist_ok=True)
+
+    # Exclusive create: exactly one process generates the ID, the rest read it
+    try:
+        with open(NODE_ID_FILE, 'x') as f:
+            node_id = str(uuid.uuid4())
+            f.write(node_id)
+    except FileExistsError:
         with open(NODE_ID_FILE, 'r') as f:
             return f.read().strip()
-    node_id = str(uuid.uuid4())
-    with open(NODE_ID_FILE, 'w') as f:
-        f.write(node_id)
     print(f"🎉 New node ID generated: {node_id}")
     return node_id
 
+# JSON state files keyed by path: ((st_mtime_ns, st_size), parsed data, raw bytes)
+_json_cache: Dict[str, Tuple[Tuple[int, int], Any, bytes]] = {}
+
 def read_json_file(filepath):
+    """Read a JSON state file, reusing the parsed data while it is unchanged.
+
+    The cache is keyed on the file's mtime and size, so any rewrite (a local
+    write or a git pull) invalidates it, even within the mtime granularity.
+    The returned object is shared with the cache and must not be modified in
+    place; writers build an updated copy and pass it to write_json_file.
+    """
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        # A cache hit costs a single stat call
+        stat = os.stat(filepath)
+        cached = _json_cache.get(filepath)
+        if cached and cached[0] == (stat.st_mtime_ns, stat.st_size):
+            return cached[1]
+
+        with open(filepath, 'rb') as f:
+            # Key on the file actually read, in case it was replaced since the stat
+            stat = os.fstat(f.fileno())
+            raw = f.read()
+            data = orjson.loads(raw)
+        _json_cache[filepath] = ((stat.st_mtime_ns, stat.st_size), data, raw)
+        return data
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        _json_cache.pop(filepath, None)
         return None
 
+def write_json_file(filepath, data):
+    """Atomically replace a JSON state file, keeping the repo's 2-space layout.
+
+    The data is written to a sibling temp file and moved into place with
+    os.replace, so readers never see a half-written file. The temp name is
+    per process because several nodes may share one checkout. The written
+    object is cached as the parse of the new file, so reading it back is free.
+    Data that serializes to the unchanged file's bytes is not rewritten; the
+    bytes are compared rather than the cached parse, which callers may have
+    modified in place.
+    """
+    raw = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    cached = _json_cache.get(filepath)
+    if cached and cached[2] == raw:
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
+            pass
+        else:
+            if cached[0] == (stat.st_mtime_ns, stat.st_size):
+                return
+
+    tmp_path = f"{filepath}.tmp.{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(raw)
+    stat = os.stat(tmp_path)
+    os.replace(tmp_path, filepath)
+    _json_cache[filepath] = ((stat.st_mtime_ns, stat.st_size), data, raw)
+
+def heartbeat_ms(assignment: Dict[str, Any]) -> int:
+    """Return an assignment's task heartbeat as unix epoch milliseconds.
+
+    Assignments written before ``task_heartbeat_ms`` was added only carry the
+    ISO-8601 ``task_heartbeat``; it is parsed as a fallback. A missing or
+    malformed heartbeat counts as the epoch, so the task is seen as orphaned.
+    """
+    heartbeat = assignment.get("task_heartbeat_ms")
+    if isinstance(heartbeat, int):
+        return heartbeat
+    try:
+        return int(datetime.fromisoformat(assignment["task_heartbeat"]).timestamp() * 1000)
+    except (KeyError, TypeError, ValueError):
+        return 0
+
+class StateFileWatcher:
+    """Waits for the node's state files to change on disk.
+
+    One watch stays open for the watcher's lifetime, so changes that land
+    while the node is busy scanning are buffered and returned by the next
+    wait instead of being missed. The parent directory is watched rather
+    than the files themselves because git and write_json_file replace files
+    instead of rewriting them in place. Without watchfiles, waiting is a
+    plain sleep.
+    """
+
+    def __init__(self, filepaths, timeout: timedelta) -> None:
+        self.timeout = timeout
+        self.watcher = None
+        if WATCHFILES_SUPPORT:
+            watched = {os.path.abspath(path) for path in filepaths}
+            self.watcher = watchfiles.watch(
+                *{os.path.dirname(path) for path in watched},
+                watch_filter=lambda change, path: os.path.abspath(path) in watched,
+                recursive=False,
+                debounce=200,
+                rust_timeout=int(timeout.total_seconds() * 1000),
+                yield_on_timeout=True,
+            )
+
+    def wait(self) -> bool:
+        """Block until a watched file changes or the timeout elapses.
+
+        Returns:
+            bool: True if a change was seen, False on timeout
+        """
+        if not self.watcher:
+            time.sleep(self.timeout.total_seconds())
+            return False
+        return bool(next(self.watcher))
+
 # --- State Machine Logic ---
 class Node(ComponentLogger):
     def __init__(self):
         super().__init__('node')
         self.node_id = get_node_id()
+        enable_ssh_connection_reuse()
         self.state = NodeState.IDLE
         self.current_task = None
         self.last_roster_heartbeat = None
+        self.claim_failures = 0
+        self.recover_failures = 0
+        # Lost claim races per task, widening the jitter before the next attempt
+        self.claim_backoff: Dict[str, int] = {}
+
+        # Renderer images are built while the claim is in flight: (task_id, build)
+        self.build_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-build")
+        self.image_build: Optional[Tuple[str, Future]] = None
+        self.claim_store = ClaimStore(CLAIM_DB_FILE) if CLAIM_DB_FILE else None
+        self.state_watcher = StateFileWatcher([SCHEDULE_FILE, ASSIGNMENTS_FILE], IDLE_PULL_INTERVAL)
+
+        # One docker client for the node's lifetime keeps the daemon connection alive
+        self.docker = None
+        if DOCKER_SDK_SUPPORT:
+            try:
+                self.docker = docker.from_env()
+            except docker.errors.DockerException as e:
+                print(f"    ⚠️ Docker SDK unavailable, using the docker CLI: {e}")
 
         # Initialize regional coordination if available
         self.regional_coordinator = None
@@ -432,13 +967,17 @@ class Node(ComponentLogger):
         self.logger.error("Emergency reset initiated", error_source=error_source)
         
         try:
-            with log_operation(self.logger, "emergency_reset"):
-                main_branch = run_command(['git', 'rev-parse', '--abbrev-ref', 'HEAD'], suppress_errors=True).strip()
-                if not main_branch:
-                    main_branch = 'main'  # Fallback
-                run_command(['git', 'fetch', 'origin'])
-                run_command(['git', 'reset', '--hard', f'origin/{main_branch}'])
-                self.logger.info("Local repository reset completed")
+            with _git_lock, log_operation(self.logger, "emergency_reset"):
+                main_branch = current_branch() or 'main'  # Fallback
+                # No --depth: it would make a full clone permanently shallow, and
+                # the reset below does not undo that
+                run_command(['git', 'fetch', 'origin', main_branch], capture_stdout=False)
+                # Nothing new upstream and nothing local to discard: skip the reset
+                if git_is_at(f'origin/{main_branch}'):
+                    self.logger.info("Local repository already matches remote")
+                else:
+                    git_reset_hard(f'origin/{main_branch}')
+                    self.logger.info("Local repository reset completed")
         except Exception as reset_e:
             self.logger.critical("Emergency reset failed", error=str(reset_e))
         finally:
@@ -447,10 +986,22 @@ class Node(ComponentLogger):
             self.current_task = None
             
             log_state_change(self.logger, "node_state", old_state, self.state)
-            self.logger.info("Waiting before retry", wait_seconds=15)
-            time.sleep(15)
+
+            # Back off exponentially while failures persist: ~2s after a blip, up to 5 min in an outage
+            self.recover_failures += 1
+            wait_seconds = min(2 ** min(self.recover_failures, 9), 300) + random.uniform(0, 5)
+            self.logger.info("Waiting before retry",
+                           wait_seconds=round(wait_seconds, 1),
+                           consecutive_failures=self.recover_failures)
+            time.sleep(wait_seconds)
 
     def run(self) -> None:
+        # Git syncing and roster heartbeats run beside the state machine so the
+        # idle state only has to wait for the state files to change
+        for target, name in ((self._sync_loop, "git-sync"),
+                             (self._housekeeping_loop, "housekeeping")):
+            threading.Thread(target=target, name=name, daemon=True).start()
+
         while True:
             try:
                 with log_operation(self.logger, "state_execution", current_state=self.state):
@@ -460,6 +1011,7 @@ class Node(ComponentLogger):
                         self.run_attempt_claim_state()
                     elif self.state == NodeState.ACTIVE:
                         self.run_active_state()
+                self.recover_failures = 0
             except subprocess.CalledProcessError as e:
                 self._recover_and_reset(f"Git operation: {' '.join(e.cmd)}")
             except Exception as e:
@@ -471,46 +1023,136 @@ class Node(ComponentLogger):
                 log_state_change(self.logger, "node_state", old_state, self.state)
                 time.sleep(30)
 
-    @log_execution_time
+    @log_execution_time(node_logger)
     def run_idle_state(self) -> None:
-        # Roster heartbeat if needed
-        if not self.last_roster_heartbeat or (datetime.now(timezone.utc) - self.last_roster_heartbeat) > HEARTBEAT_INTERVAL:
-            self.perform_roster_heartbeat()
-
         self.logger.info("Checking available tasks")
         git_pull()
-        
-        schedule = read_json_file(SCHEDULE_FILE) or {"tasks": []}
-        sorted_tasks = sorted(schedule.get("tasks", []), key=lambda x: x.get("priority", 999))
-        assignments = read_json_file(ASSIGNMENTS_FILE) or {"assignments": {}}
 
-        assigned_tasks = set(assignments.get("assignments", {}).keys())
-        now = datetime.now(timezone.utc)
-
-        candidate_task = None
-        for task in sorted_tasks:
-            task_id = task["id"]
-            if task_id not in assigned_tasks:
-                print(f"    - Free task found: {task_id}")
-                candidate_task = task
-                break # Prendi il primo libero
+        # Rescan whenever the sync thread pulls in new state; after a quiet
+        # IDLE_PULL_INTERVAL return to run() so the next pass pulls explicitly
+        while True:
+            candidate_task = self._find_candidate_task()
+            if candidate_task:
+                self.current_task = candidate_task
+                self.image_build = (candidate_task['id'],
+                                    self.build_executor.submit(self._build_task_image, candidate_task))
+                self.state = NodeState.ATTEMPT_CLAIM
+                return
+
+            print(f"[{self.state}] No free or orphaned tasks. Waiting up to {IDLE_PULL_INTERVAL.seconds}s for changes.")
+            if not self.state_watcher.wait():
+                return
+
+    def _find_candidate_task(self) -> Optional[Dict[str, Any]]:
+        """Return the highest-priority free or orphaned task, if any."""
+        # Not while the sync thread is pulling or recovering from a failed pull
+        with _git_lock:
+            schedule = read_json_file(SCHEDULE_FILE) or {"tasks": []}
+            assignments = read_json_file(ASSIGNMENTS_FILE) or {"assignments": {}}
+
+        # Only the scheduled tasks are looked up, so the scan stays O(tasks)
+        # however many assignments the file holds
+        assigned = assignments.get("assignments", {})
+        now_ms = int(time.time() * 1000)
+
+        # Single pass for the lowest priority number; on ties the first task
+        # in schedule order wins, as with a stable sort
+        best_task = None
+        best_priority = float('inf')
+        for task in schedule.get("tasks", []):
+            priority = task.get("priority", 999)
+            if priority >= best_priority:
+                continue
+
+            assignment = assigned.get(task["id"])
+            # Libero, oppure orfano
+            if assignment is None or now_ms - heartbeat_ms(assignment) > TASK_EXPIRATION_MS:
+                best_task = task
+                best_priority = priority
+
+        if best_task:
+            assignment = assigned.get(best_task["id"])
+            if assignment is None:
+                print(f"    - Free task found: {best_task['id']}")
             else:
-                # Controlla se il task è orfano
-                assignment = assignments["assignments"][task_id]
-                heartbeat_time = datetime.fromisoformat(assignment["task_heartbeat"])
-                if (now - heartbeat_time) > TASK_EXPIRATION:
-                    print(f"    - Orphaned task found: {task_id} (last heartbeat: {heartbeat_time})")
-                    candidate_task = task
-                    break
-        
-        if candidate_task:
-            self.current_task = candidate_task
-            self.state = NodeState.ATTEMPT_CLAIM
-        else:
-            print(f"[{self.state}] No free or orphaned tasks. Waiting {IDLE_PULL_INTERVAL.seconds}s.")
-            time.sleep(IDLE_PULL_INTERVAL.seconds)
+                print(f"    - Orphaned task found: {best_task['id']} (last heartbeat: {assignment.get('task_heartbeat')})")
+        return best_task
 
-    @log_execution_time
+    def _prefetch(self) -> None:
+        """Fetch remote changes ahead of the next pull (best effort)."""
+        try:
+            git_fetch()
+        except Exception as e:
+            self.logger.warning("Prefetch failed",
+                              error=str(e),
+                              error_type=type(e).__name__)
+
+    def _build_task_image(self, task: Dict[str, Any]) -> None:
+        """Build the renderer image for a candidate task (runs on build_executor)."""
+        DockerManager(task['type'], task['id'], self.node_id, self.logger,
+                      client=self.docker).build_image()
+
+    def _sync_loop(self) -> None:
+        """Pull the repository every IDLE_SYNC_INTERVAL while the node is idle.
+
+        Runs on a daemon thread started by run. The pulled state files wake
+        run_idle_state through its file watch. Other states pull on their own.
+        """
+        elapsed = 0.0
+        while True:
+            # Count the last pull against the interval so slow pulls do not
+            # stretch the sync period
+            time.sleep(max(0.0, IDLE_SYNC_INTERVAL.total_seconds() - elapsed))
+            tick_start = time.monotonic()
+            if self.state == NodeState.IDLE:
+                # Held across the recovery so no scan reads a conflicted file
+                with _git_lock:
+                    try:
+                        git_pull()
+                    except Exception as e:
+                        self.logger.warning("Background sync failed",
+                                          error=str(e),
+                                          error_type=type(e).__name__)
+                        try:
+                            git_reset_to_upstream()
+                        except Exception as reset_e:
+                            self.logger.error("Reset after failed background sync failed",
+                                           error=str(reset_e))
+            elapsed = time.monotonic() - tick_start
+
+    def _housekeeping_loop(self) -> None:
+        """Send a roster heartbeat every HEARTBEAT_INTERVAL, whatever the node state.
+
+        Runs on a daemon thread started by run.
+        """
+        # psutil is only needed for heartbeat metrics, so it is imported here,
+        # off the startup path; priming it lets heartbeats read CPU use without sampling
+        try:
+            import psutil
+            psutil.cpu_percent(interval=None)
+        except ImportError:
+            pass
+        failures = 0
+        while True:
+            now = datetime.now(timezone.utc)
+            wait = HEARTBEAT_INTERVAL
+            if self._roster_heartbeat_due(now):
+                self.perform_roster_heartbeat()
+                if self._roster_heartbeat_due(datetime.now(timezone.utc)):
+                    # The heartbeat failed: retry after a short backoff rather
+                    # than a full interval, which could drop the node from the roster
+                    failures += 1
+                    wait = timedelta(seconds=min(2 ** min(failures, 6), ROSTER_RETRY_MAX_BACKOFF.total_seconds())
+                                     + random.uniform(0, 1))
+                else:
+                    failures = 0
+            elif self.last_roster_heartbeat:
+                # An ACTIVE node's task heartbeat carried the roster update;
+                # sleep until the next one is due
+                wait = self.last_roster_heartbeat + HEARTBEAT_INTERVAL - now
+            time.sleep(wait.total_seconds())
+
+    @log_execution_time(node_logger)
     def run_attempt_claim_state(self) -> None:
         task_id = self.current_task['id']
         self.logger.info("Attempting to claim task", task_id=task_id)
@@ -523,26 +1165,31 @@ class Node(ComponentLogger):
 
         if success:
             print(f"    - ✅ Successfully claimed {self.current_task['id']}!")
+            self.claim_backoff.pop(task_id, None)
             self.state = NodeState.ACTIVE
         else:
             print(f"    - Failed to claim {self.current_task['id']}. Returning to IDLE.")
+            self.claim_backoff[task_id] = min(self.claim_backoff.get(task_id, 0) + 1, 6)
             self.state = NodeState.IDLE
 
+    def _claim_jitter(self) -> None:
+        """Sleep a random delay before claiming, doubling the window per lost race."""
+        failures = self.claim_backoff.get(self.current_task['id'], 0)
+        wait_ms = random.randint(0, min(JITTER_MILLISECONDS * 2 ** failures, 60_000))
+        self.logger.debug("Applying jitter delay", wait_ms=wait_ms, failures=failures)
+        time.sleep(wait_ms / 1000.0)
+
     def _attempt_claim_with_regional_coordinator(self) -> bool:
         """Attempt to claim task using regional coordinator."""
 
-        # Jitter
-        wait_ms = random.randint(0, JITTER_MILLISECONDS)
-        self.logger.debug("Applying jitter delay", wait_ms=wait_ms)
-        time.sleep(wait_ms / 1000.0)
+        self._claim_jitter()
 
         # Check if we can claim this task regionally
         can_claim, reason = self.regional_coordinator.can_claim_task(self.current_task, self.node_id)
         if not can_claim:
-            self.logger.info("Cannot claim task due to regional constraints", {
-                'task_id': self.current_task['id'],
-                'reason': reason
-            })
+            self.logger.info("Cannot claim task due to regional constraints",
+                           task_id=self.current_task['id'],
+                           reason=reason)
             return False
 
         # Attempt to claim with lease
@@ -551,30 +1198,79 @@ class Node(ComponentLogger):
 
     def _attempt_claim_legacy(self) -> bool:
         """Attempt to claim task using legacy behavior."""
+        task_id = self.current_task['id']
 
-        # Jitter
-        wait_ms = random.randint(0, JITTER_MILLISECONDS)
-        self.logger.debug("Applying jitter delay", wait_ms=wait_ms)
-        time.sleep(wait_ms / 1000.0)
+        if self.claim_store:
+            # Local nodes arbitrate through the claim store; git only records the winner
+            if not self.claim_store.claim(task_id, self.node_id, datetime.now(timezone.utc), TASK_EXPIRATION):
+                self.logger.info("Task already claimed by a local node", task_id=task_id)
+                return False
+
+            claimed = False
+            try:
+                claimed = self._commit_claim()
+                return claimed
+            finally:
+                if not claimed:
+                    self.claim_store.release(task_id, self.node_id)
 
+        self._claim_jitter()
+
+        return self._commit_claim()
+
+    def _commit_claim(self) -> bool:
+        """Record the claim of the current task in assignments.json and push it.
+
+        A rejected push means another node pushed first: the local commit is
+        dropped and the claim re-checked against the new remote state after an
+        exponential backoff, rather than going through the emergency reset.
+        """
+        for attempt in range(1, MAX_CLAIM_ATTEMPTS + 1):
+            try:
+                with _git_lock:
+                    claimed = self._write_claim()
+            except subprocess.CalledProcessError as e:
+                if e.cmd[:2] != ['git', 'push'] or attempt == MAX_CLAIM_ATTEMPTS:
+                    raise
+                git_reset_hard('@{upstream}')
+
+                self.claim_failures += 1
+                backoff = random.uniform(0, min(2 ** min(self.claim_failures, 8), 60)) * 0.1
+                self.logger.info("Claim push rejected, retrying",
+                               task_id=self.current_task['id'],
+                               attempt=attempt,
+                               backoff_seconds=round(backoff, 2))
+                time.sleep(backoff)
+                continue
+
+            if claimed:
+                self.claim_failures = 0
+            return claimed
+        return False
+
+    def _write_claim(self) -> bool:
         # Pull finale prima del tentativo
         git_pull()
 
+        # One clock read for the recheck and the new assignment
+        now = datetime.now(timezone.utc)
+        now_ms = int(now.timestamp() * 1000)
+
         # Recheck if the task is still available
         assignments = read_json_file(ASSIGNMENTS_FILE) or {"assignments": {}}
         if self.current_task['id'] in assignments["assignments"]:
              # Check if it's orphaned, otherwise it was taken
             assignment = assignments["assignments"][self.current_task['id']]
-            heartbeat_time = datetime.fromisoformat(assignment.get("task_heartbeat", "1970-01-01T00:00:00+00:00"))
-            if (datetime.now(timezone.utc) - heartbeat_time) < TASK_EXPIRATION:
+            if now_ms - heartbeat_ms(assignment) < TASK_EXPIRATION_MS:
                 return False
 
         # Claim the task
-        now_iso = datetime.now(timezone.utc).isoformat()
+        now_iso = now.isoformat()
         task_assignment = {
             "node_id": self.node_id,
             "claimed_at": now_iso,
             "task_heartbeat": now_iso,
+            "task_heartbeat_ms": now_ms,
             "status": "claiming"
         }
 
@@ -582,17 +1278,20 @@ class Node(ComponentLogger):
         if self.geo_manager:
             task_assignment["region"] = self.geo_manager.current_region
 
-        assignments.setdefault("assignments", {})[self.current_task['id']] = task_assignment
+        # Copy on write: the parsed file is shared with the read cache
+        assignments = {
+            **assignments,
+            "assignments": {**assignments.get("assignments", {}), self.current_task['id']: task_assignment}
+        }
 
         # Write to assignments file, using cwd as base
         assignments_path = os.path.join(os.getcwd(), ASSIGNMENTS_FILE)
-        with open(assignments_path, 'w') as f:
-            json.dump(assignments, f, indent=2)
+        write_json_file(assignments_path, assignments)
 
         commit_message = f"feat(assignments): node {self.node_id[:8]} claims {self.current_task['id']}"
         return commit_and_push([ASSIGNMENTS_FILE], commit_message)
 
-    @log_execution_time
+    @log_execution_time(node_logger)
     def run_active_state(self) -> None:
         task_id = self.current_task['id']
         task_type = self.current_task['type']
@@ -602,23 +1301,41 @@ class Node(ComponentLogger):
             
             try:
                 # Initialize Docker manager
-                docker_manager = DockerManager(task_type, task_id, self.node_id, self.logger)
+                docker_manager = DockerManager(task_type, task_id, self.node_id, self.logger,
+                                               client=self.docker)
+
+                # Fetch while the image builds, so the first task heartbeat's
+                # pull only has to merge (it waits on the git lock meanwhile)
+                threading.Thread(target=self._prefetch, name="git-prefetch", daemon=True).start()
 
                 # Build and start container
-                docker_manager.build_image()
+                image_build, self.image_build = self.image_build, None
+                if image_build and image_build[0] == task_id:
+                    image_build[1].result()  # Started during the claim; re-raises build errors
+                else:
+                    docker_manager.build_image()
                 container_id = docker_manager.start_container()
                 
                 self.logger.info("Container started",
                                container_id=container_id[:12])
                 
-                # Monitoring and health check loop
-                last_health_check = datetime.now(timezone.utc)
+                # Task heartbeats run on a background thread so slow git
+                # round-trips never delay noticing that the container died
+                stop_heartbeat = threading.Event()
+                # Set when the assignment is lost or the container dies
+                interrupted = threading.Event()
+                heartbeat_thread = threading.Thread(
+                    target=self._task_heartbeat_loop,
+                    args=(task_id, stop_heartbeat, interrupted),
+                    name=f"task-heartbeat-{task_id}",
+                    daemon=True
+                )
+                heartbeat_thread.start()
+                docker_manager.watch_exit(interrupted)
                 
-                while True:
-                    now = datetime.now(timezone.utc)
-                    
-                    # Check container health
-                    if now - last_health_check >= HEALTH_CHECK_INTERVAL:
+                # Monitoring and health check loop
+                try:
+                    while not interrupted.wait(HEALTH_CHECK_INTERVAL.total_seconds()):
                         if not docker_manager.is_running():
                             self.logger.warning("Container stopped unexpectedly",
                                             container_id=container_id[:12])
@@ -629,29 +1346,9 @@ class Node(ComponentLogger):
                                            container_id=container_id[:12],
                                            failures=docker_manager.health_check_failures)
                             break
-                        
-                        last_health_check = now
-                    
-                    # Perform task heartbeat
-                    with log_operation(self.logger, "task_heartbeat"):
-                        git_pull()
-                        assignments = read_json_file(ASSIGNMENTS_FILE) or {"assignments": {}}
-                        current_assignment = assignments.get("assignments", {}).get(task_id)
-                        
-                        if not current_assignment or current_assignment["node_id"] != self.node_id:
-                            self.logger.warning("Lost task assignment")
-                            break
-                        
-                        assignments["assignments"][task_id]["task_heartbeat"] = now.isoformat()
-                        assignments["assignments"][task_id]["status"] = "streaming"
-                        
-                        with open(ASSIGNMENTS_FILE, 'w') as f:
-                            json.dump(assignments, f, indent=2)
-                        
-                        commit_message = f"chore(assignments): task heartbeat for {task_id} from node {self.node_id[:8]}"
-                        commit_and_push([ASSIGNMENTS_FILE], commit_message)
-                    
-                    time.sleep(TASK_HEARTBEAT_INTERVAL.seconds)
+                finally:
+                    stop_heartbeat.set()
+                    heartbeat_thread.join(timeout=HEALTH_CHECK_INTERVAL.total_seconds())
                 
                 # Clean up
                 docker_manager.stop_container()
@@ -663,69 +1360,171 @@ class Node(ComponentLogger):
                 if 'docker_manager' in locals():
                     docker_manager.stop_container()
 
+            if self.claim_store:
+                self.claim_store.release(task_id, self.node_id)
+
             # End of work, return to IDLE
             self.logger.info("Task finished")
             self.current_task = None
             self.state = NodeState.IDLE
 
-    @log_execution_time
+    def _task_heartbeat_loop(self, task_id: str, stop_event: threading.Event,
+                             task_lost: threading.Event) -> None:
+        """Refresh the task heartbeat in assignments.json until told to stop.
+        
+        Runs on a daemon thread started by run_active_state. A failed heartbeat
+        (typically a push rejected because another node pushed first) drops
+        the local commit and is retried on the next tick. Sets ``task_lost``
+        and returns if the assignment was taken over, or if no heartbeat has
+        succeeded for TASK_HEARTBEAT_GIVE_UP and the task may soon be orphaned.
+        """
+        # The claim itself was the last heartbeat written
+        last_success = time.monotonic()
+        consecutive_failures = 0
+        while not stop_event.is_set():
+            tick_start = time.monotonic()
+            # Carry the roster heartbeat in this commit when it falls due before
+            # the next tick, instead of a separate roster commit and push
+            metrics = None
+            if self._roster_heartbeat_due(datetime.now(timezone.utc), lead=TASK_HEARTBEAT_INTERVAL):
+                metrics = self._collect_metrics()
+            try:
+                with _git_lock, log_operation(self.logger, "task_heartbeat"):
+                    git_pull()
+                    assignments = read_json_file(ASSIGNMENTS_FILE) or {"assignments": {}}
+                    current_assignment = assignments.get("assignments", {}).get(task_id)
+                    
+                    if not current_assignment or current_assignment["node_id"] != self.node_id:
+                        self.logger.warning("Lost task assignment")
+                        task_lost.set()
+                        return
+                    
+                    now = datetime.now(timezone.utc)
+                    if self.claim_store and not self.claim_store.heartbeat(task_id, self.node_id, now):
+                        self.logger.warning("Lost local task claim")
+                        task_lost.set()
+                        return
+                    
+                    # Copy on write: the parsed file is shared with the read cache
+                    updated_assignment = {
+                        **current_assignment,
+                        "task_heartbeat": now.isoformat(),
+                        "task_heartbeat_ms": int(now.timestamp() * 1000),
+                        "status": "streaming"
+                    }
+                    assignments = {
+                        **assignments,
+                        "assignments": {**assignments["assignments"], task_id: updated_assignment}
+                    }
+                    
+                    write_json_file(ASSIGNMENTS_FILE, assignments)
+                    files = [ASSIGNMENTS_FILE]
+                    commit_message = f"chore(assignments): task heartbeat for {task_id} from node {self.node_id[:8]}"
+                    if metrics is not None:
+                        roster = self._build_roster_update(read_json_file(ROSTER_FILE) or {"nodes": []},
+                                                           metrics, now.isoformat())
+                        write_json_file(ROSTER_FILE, roster)
+                        files.append(ROSTER_FILE)
+                        commit_message += " with roster heartbeat"
+                    
+                    commit_and_push(files, commit_message)
+                    if metrics is not None:
+                        self.last_roster_heartbeat = now
+                last_success = time.monotonic()
+                consecutive_failures = 0
+            except Exception as e:
+                consecutive_failures += 1
+                self.logger.error("Task heartbeat failed",
+                               error=str(e),
+                               error_type=type(e).__name__,
+                               consecutive_failures=consecutive_failures)
+                try:
+                    # Drop the unpushed heartbeat commit so the next pull starts clean
+                    git_reset_hard('@{upstream}')
+                except Exception as reset_e:
+                    self.logger.error("Reset after failed task heartbeat failed",
+                                   error=str(reset_e))
+                if time.monotonic() - last_success >= TASK_HEARTBEAT_GIVE_UP.total_seconds():
+                    self.logger.warning("Giving up task after repeated heartbeat failures",
+                                      consecutive_failures=consecutive_failures)
+                    task_lost.set()
+                    return
+            
+            # Sleep the rest of the interval so slow pulls and pushes do not
+            # stretch the heartbeat period
+            elapsed = time.monotonic() - tick_start
+            stop_event.wait(max(0.0, TASK_HEARTBEAT_INTERVAL.total_seconds() - elapsed))
+
+    def _roster_heartbeat_due(self, now: datetime, lead: timedelta = timedelta(0)) -> bool:
+        """Whether a roster heartbeat is due at ``now + lead``."""
+        return (self.last_roster_heartbeat is None
+                or now + lead - self.last_roster_heartbeat >= HEARTBEAT_INTERVAL)
+
+    def _collect_metrics(self) -> Dict[str, float]:
+        """Sample CPU and memory use for the roster entry."""
+        try:
+            import psutil
+            # CPU use since the previous heartbeat, without blocking to sample
+            cpu_load = psutil.cpu_percent(interval=None)
+            memory_percent = psutil.virtual_memory().percent
+            print(f"    - System metrics: CPU {cpu_load}%, Memory {memory_percent}%")
+            return {
+                "cpu_load": round(cpu_load, 1),
+                "memory_percent": round(memory_percent, 1)
+            }
+        except Exception as e:
+            print(f"    - ⚠️ Could not collect metrics: {e}")
+            return {
+                "cpu_load": 0.0,
+                "memory_percent": 0.0
+            }
+
+    def _build_roster_update(self, roster: Dict[str, Any], metrics: Dict[str, float],
+                             current_time: str) -> Dict[str, Any]:
+        """Return a copy of ``roster`` with this node's entry refreshed.
+
+        Copy on write: the parsed file is shared with the read cache.
+        """
+        nodes = list(roster["nodes"])
+        for i, node in enumerate(nodes):
+            if node["id"] == self.node_id:
+                node = nodes[i] = {**node, "last_seen": current_time, "metrics": metrics}
+                break
+        else:
+            node = {
+                "id": self.node_id,
+                "started_at": current_time,
+                "last_seen": current_time,
+                "metrics": metrics
+            }
+            nodes.append(node)
+
+        # Add regional context if available
+        if self.geo_manager:
+            node["region"] = self.geo_manager.current_region
+        return {**roster, "nodes": nodes}
+
+    @log_execution_time(node_logger)
     def perform_roster_heartbeat(self) -> None:
         self.logger.info("Performing roster heartbeat")
         try:
-            with log_operation(self.logger, "roster_heartbeat"):
-                git_pull()
-                roster = read_json_file(ROSTER_FILE) or {"nodes": []}
+            metrics = self._collect_metrics()
 
-            # Collect system metrics
-            try:
-                cpu_load = psutil.cpu_percent(interval=1)
-                memory_percent = psutil.virtual_memory().percent
-                metrics = {
-                    "cpu_load": round(cpu_load, 1),
-                    "memory_percent": round(memory_percent, 1)
-                }
-                print(f"    - System metrics: CPU {cpu_load}%, Memory {memory_percent}%")
-            except Exception as e:
-                print(f"    - ⚠️ Could not collect metrics: {e}")
-                metrics = {
-                    "cpu_load": 0.0,
-                    "memory_percent": 0.0
-                }
-
-            node_found = False
-            current_time = datetime.now(timezone.utc).isoformat()
-
-            for node in roster["nodes"]:
-                if node["id"] == self.node_id:
-                    node["last_seen"] = current_time
-                    node["metrics"] = metrics
-                    # Add regional context if available
-                    if self.geo_manager:
-                        node["region"] = self.geo_manager.current_region
-                    node_found = True
-                    break
-
-            if not node_found:
-                new_node = {
-                    "id": self.node_id,
-                    "started_at": current_time,
-                    "last_seen": current_time,
-                    "metrics": metrics
-                }
-                # Add regional context if available
-                if self.geo_manager:
-                    new_node["region"] = self.geo_manager.current_region
-
-                roster["nodes"].append(new_node)
+            # Hold the git lock from pull to push so the sync thread cannot
+            # pull over the uncommitted roster
+            with _git_lock, log_operation(self.logger, "roster_heartbeat"):
+                git_pull()
+                now = datetime.now(timezone.utc)
+                roster = self._build_roster_update(read_json_file(ROSTER_FILE) or {"nodes": []},
+                                                   metrics, now.isoformat())
             
-            # Write to roster file, using cwd as base
-            roster_path = os.path.join(os.getcwd(), ROSTER_FILE)
-            with open(roster_path, 'w') as f:
-                json.dump(roster, f, indent=2)
-
-            commit_message = f"chore(roster): heartbeat from node {self.node_id[:8]}"
-            commit_and_push([ROSTER_FILE], commit_message)
-            self.last_roster_heartbeat = datetime.now(timezone.utc)
+                # Write to roster file, using cwd as base
+                roster_path = os.path.join(os.getcwd(), ROSTER_FILE)
+                write_json_file(roster_path, roster)
+
+                commit_message = f"chore(roster): heartbeat from node {self.node_id[:8]}"
+                commit_and_push([ROSTER_FILE], commit_message)
+            self.last_roster_heartbeat = now
         except Exception as e:
             print(f"    - 🚨 Error during roster heartbeat: {e}")
 
@@ -1,6 +1,9 @@
 import os
-import json
+import functools
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, Optional
 from flask import Flask, render_template, request, jsonify, Response, stream_with_context
@@ -27,20 +30,38 @@ SHORTLIST_FILE = "/app/data/shortlist.json"
 ROSTER_FILE = "/app/data/roster.json"
 ASSIGNMENTS_FILE = "/app/data/assignments.json"
 
+# One keep-alive connection pool for all calls to the Governance API. Connect
+# errors are not retried: an unresolvable or stopped container should fail fast.
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                                     max_retries=Retry(total=2, connect=0, backoff_factor=0.1)))
+
+# Resolved Governance API URL, keyed by the (mtime_ns, size) of assignments.json
+_api_url_cache: Optional[tuple] = None
+
 
 def _resolve_governance_api_url() -> Optional[str]:
     """Resolve the current Governance API URL based on assignments.
     Returns the base URL like http://container-name:8000 or None if unavailable.
     """
+    global _api_url_cache
+    try:
+        stat = os.stat(ASSIGNMENTS_FILE)
+        key = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        key = None
+    if key is not None and _api_url_cache and _api_url_cache[0] == key:
+        return _api_url_cache[1]
+
+    api_url = None
     assignments = read_json_file(ASSIGNMENTS_FILE) or {"assignments": {}}
     governance_assignment = assignments.get("assignments", {}).get("shortlist_governance_api")
-    if not governance_assignment:
-        return None
-    node_id = governance_assignment.get("node_id")
-    if not node_id:
-        return None
-    container_name = f"shortlist_governance_api-{node_id[:8]}"
-    return f"http://{container_name}:8000"
+    node_id = governance_assignment.get("node_id") if governance_assignment else None
+    if node_id:
+        container_name = f"shortlist_governance_api-{node_id[:8]}"
+        api_url = f"http://{container_name}:8000"
+    _api_url_cache = (key, api_url)
+    return api_url
 
 @log_execution_time(logger.logger)
 def read_json_file(filepath: str) -> Dict[str, Any]:
@@ -53,15 +74,24 @@ def read_json_file(filepath: str) -> Dict[str, Any]:
         Dict containing the file contents or empty dict on error
     """
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError) as e:
         logger.logger.warning("Failed to read JSON file",
                             error=str(e),
                             error_type=type(e).__name__,
                             filepath=filepath)
         return {}
 
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_ts(value: str) -> float:
+    """Parse an ISO-8601 timestamp to epoch seconds.
+
+    Cached on the raw string: roster and heartbeat timestamps repeat between
+    dashboard refreshes until their node writes a new one.
+    """
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+
 @log_execution_time(logger.logger)
 def parse_items_from_text(text: str) -> List[str]:
     """Parse shortlist items from textarea input
@@ -75,7 +105,7 @@ def parse_items_from_text(text: str) -> List[str]:
     with log_operation(logger.logger, "parse_content", content_length=len(text)):
         try:
             # Try to parse as JSON first
-            data = json.loads(text)
+            data = orjson.loads(text)
             if isinstance(data, dict) and "items" in data:
                 items = data["items"]
                 logger.logger.info("Parsed JSON object format", items_count=len(items))
@@ -86,7 +116,7 @@ def parse_items_from_text(text: str) -> List[str]:
             else:
                 logger.logger.info("Parsed single JSON value")
                 return [str(data)]
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # Fallback: treat as line-separated text
             lines = [line.strip() for line in text.split('\n') if line.strip()]
             logger.logger.info("Parsed line-separated format", lines_count=len(lines))
@@ -111,70 +141,79 @@ def get_swarm_status():
             assignments = read_json_file(ASSIGNMENTS_FILE)
             shortlist = read_json_file(SHORTLIST_FILE)
 
-        # Process roster data
-        nodes = []
-        current_time = datetime.utcnow().replace(tzinfo=timezone.utc)
-
-        for node in roster.get("nodes", []):
-            try:
-                last_seen = datetime.fromisoformat(node["last_seen"].replace('Z', '+00:00'))
-                time_diff = (current_time - last_seen).total_seconds()
-                is_alive = time_diff < 300  # 5 minutes threshold
-
-                nodes.append({
-                    "id": node["id"][:8] + "...",
-                    "full_id": node["id"],
-                    "started_at": node.get("started_at", ""),
-                    "last_seen": node["last_seen"],
-                    "is_alive": is_alive,
-                    "time_since_last_seen": f"{int(time_diff)}s ago"
-                })
-            except Exception as e:
-                logger.logger.warning("Error processing node",
-                                       node_id=node.get('id', 'unknown'),
-                                       error=str(e))
+            # Process roster data
+            nodes = []
+            current_time = datetime.now(timezone.utc)
+            now_ts = current_time.timestamp()
+            alive_cutoff = now_ts - 300  # 5 minutes threshold
+            healthy_cutoff = now_ts - 120  # 2 minutes threshold
+
+            for node in roster.get("nodes", []):
+                try:
+                    last_seen_ts = _parse_iso_ts(node["last_seen"])
+                    time_diff = now_ts - last_seen_ts
+                    is_alive = last_seen_ts > alive_cutoff
+
+                    nodes.append({
+                        "id": node["id"][:8] + "...",
+                        "full_id": node["id"],
+                        "started_at": node.get("started_at", ""),
+                        "last_seen": node["last_seen"],
+                        "is_alive": is_alive,
+                        "time_since_last_seen": f"{int(time_diff)}s ago"
+                    })
+                except Exception as e:
+                    logger.logger.warning("Error processing node",
+                                           node_id=node.get('id', 'unknown'),
+                                           error=str(e))
+
+            # Process assignments data
+            tasks = []
+            for task_id, assignment in assignments.get("assignments", {}).items():
+                try:
+                    # Nodes also write the heartbeat as epoch milliseconds
+                    heartbeat_ms = assignment.get("task_heartbeat_ms")
+                    if heartbeat_ms is not None:
+                        heartbeat_ts = heartbeat_ms / 1000
+                    else:
+                        heartbeat_ts = _parse_iso_ts(assignment["task_heartbeat"])
+                    time_diff = now_ts - heartbeat_ts
+                    is_healthy = heartbeat_ts > healthy_cutoff
+
+                    tasks.append({
+                        "task_id": task_id,
+                        "node_id": assignment["node_id"][:8] + "...",
+                        "full_node_id": assignment["node_id"],
+                        "status": assignment.get("status", "unknown"),
+                        "claimed_at": assignment.get("claimed_at", ""),
+                        "task_heartbeat": assignment["task_heartbeat"],
+                        "is_healthy": is_healthy,
+                        "time_since_heartbeat": f"{int(time_diff)}s ago"
+                    })
+                except Exception as e:
+                    logger.logger.warning("Error processing task",
+                                           task_id=task_id,
+                                           error=str(e))
+
+            # Largest payload the UI polls; serialized with orjson rather than jsonify
+            return Response(orjson.dumps({
+                "nodes": nodes,
+                "tasks": tasks,
+                "shortlist": shortlist,
+                "stats": {
+                    "total_nodes": len(nodes),
+                    "alive_nodes": sum(1 for n in nodes if n["is_alive"]),
+                    "total_tasks": len(tasks),
+                    "healthy_tasks": sum(1 for t in tasks if t["is_healthy"])
+                },
+                "timestamp": current_time.isoformat()
+            }), mimetype='application/json')
 
-        # Process assignments data
-        tasks = []
-        for task_id, assignment in assignments.get("assignments", {}).items():
-            try:
-                last_heartbeat = datetime.fromisoformat(assignment["task_heartbeat"].replace('Z', '+00:00'))
-                time_diff = (current_time - last_heartbeat).total_seconds()
-                is_healthy = time_diff < 120  # 2 minutes threshold
-
-                tasks.append({
-                    "task_id": task_id,
-                    "node_id": assignment["node_id"][:8] + "...",
-                    "full_node_id": assignment["node_id"],
-                    "status": assignment.get("status", "unknown"),
-                    "claimed_at": assignment.get("claimed_at", ""),
-                    "task_heartbeat": assignment["task_heartbeat"],
-                    "is_healthy": is_healthy,
-                    "time_since_heartbeat": f"{int(time_diff)}s ago"
-                })
-            except Exception as e:
-                logger.logger.warning("Error processing task",
-                                       task_id=task_id,
-                                       error=str(e))
-
-        return jsonify({
-            "nodes": nodes,
-            "tasks": tasks,
-            "shortlist": shortlist,
-            "stats": {
-                "total_nodes": len(nodes),
-                "alive_nodes": sum(1 for n in nodes if n["is_alive"]),
-                "total_tasks": len(tasks),
-                "healthy_tasks": sum(1 for t in tasks if t["is_healthy"])
-            },
-            "timestamp": current_time.isoformat()
-        })
-
-    except Exception as e:
-        logger.logger.error("Failed to get swarm status",
-                          error=str(e),
-                          error_type=type(e).__name__)
-        return jsonify({"error": str(e)}), 500
+        except Exception as e:
+            logger.logger.error("Failed to get swarm status",
+                              error=str(e),
+                              error_type=type(e).__name__)
+            return jsonify({"error": str(e)}), 500
 
 @app.route("/api/shortlist-content")
 def get_shortlist_content():
@@ -184,15 +223,15 @@ def get_shortlist_content():
                       remote_addr=request.remote_addr):
         try:
             shortlist = read_json_file(SHORTLIST_FILE)
-        return jsonify({
-            "content": json.dumps(shortlist, indent=2),
-            "items": shortlist.get("items", [])
-        })
-    except Exception as e:
-        logger.logger.error("Failed to get shortlist content",
-                            error=str(e),
-                            error_type=type(e).__name__)
-        return jsonify({"error": str(e)}), 500
+            return jsonify({
+                "content": orjson.dumps(shortlist, option=orjson.OPT_INDENT_2).decode(),
+                "items": shortlist.get("items", [])
+            })
+        except Exception as e:
+            logger.logger.error("Failed to get shortlist content",
+                                error=str(e),
+                                error_type=type(e).__name__)
+            return jsonify({"error": str(e)}), 500
 
 @app.route("/api/governance-status")
 def get_governance_status():
@@ -201,81 +240,80 @@ def get_governance_status():
                       path=request.path,
                       remote_addr=request.remote_addr):
         try:
-        # Read assignments to get the actual container name
-        assignments = read_json_file(ASSIGNMENTS_FILE) or {"assignments": {}}
-        governance_assignment = assignments["assignments"].get("shortlist_governance_api")
-
-        if not governance_assignment:
-            return jsonify({
-                "available": False,
-                "error": "task not assigned",
-                "error_type": "no_assignment",
-                "message": "No node has claimed the governance API task yet"
-            })
+            # Read assignments to get the actual container name
+            assignments = read_json_file(ASSIGNMENTS_FILE) or {"assignments": {}}
+            governance_assignment = assignments["assignments"].get("shortlist_governance_api")
 
-        # Check if the task assignment is recent (heartbeat within last 2 minutes)
-        from datetime import datetime, timezone, timedelta
-        try:
-            last_heartbeat = datetime.fromisoformat(governance_assignment.get("task_heartbeat", "1970-01-01T00:00:00+00:00"))
-            if (datetime.now(timezone.utc) - last_heartbeat) > timedelta(minutes=2):
+            if not governance_assignment:
                 return jsonify({
                     "available": False,
-                    "error": "task assignment expired",
-                    "error_type": "stale_assignment",
-                    "message": f"Task assigned to node but heartbeat is stale (last: {governance_assignment.get('task_heartbeat', 'unknown')})"
+                    "error": "task not assigned",
+                    "error_type": "no_assignment",
+                    "message": "No node has claimed the governance API task yet"
                 })
-        except Exception:
-            pass  # Continue with connection attempt
-
-        # Construct actual container name: task_id-node_id[:8]
-        node_id = governance_assignment["node_id"]
-        container_name = f"shortlist_governance_api-{node_id[:8]}"
-        api_url = f"http://{container_name}:8000"
 
-        response = requests.get(f"{api_url}/v1/status", timeout=5)
-        if response.status_code == 200:
-            return jsonify({
-                "available": True,
-                "status": response.json(),
-                "container_name": container_name,
-                "node_id": node_id[:8]
-            })
-        else:
-            return jsonify({
-                "available": False,
-                "error": f"API returned status {response.status_code}",
-                "error_type": "http_error",
-                "container_name": container_name
-            })
-    except requests.exceptions.ConnectionError as e:
-        error_msg = str(e)
-        if "Failed to resolve" in error_msg or "Name or service not known" in error_msg:
+            # Check if the task assignment is recent (heartbeat within last 2 minutes)
+            try:
+                last_heartbeat = datetime.fromisoformat(governance_assignment.get("task_heartbeat", "1970-01-01T00:00:00+00:00"))
+                if (datetime.now(timezone.utc) - last_heartbeat) > timedelta(minutes=2):
+                    return jsonify({
+                        "available": False,
+                        "error": "task assignment expired",
+                        "error_type": "stale_assignment",
+                        "message": f"Task assigned to node but heartbeat is stale (last: {governance_assignment.get('task_heartbeat', 'unknown')})"
+                    })
+            except Exception:
+                pass  # Continue with connection attempt
+
+            # Construct actual container name: task_id-node_id[:8]
+            node_id = governance_assignment["node_id"]
+            container_name = f"shortlist_governance_api-{node_id[:8]}"
+            api_url = f"http://{container_name}:8000"
+
+            response = SESSION.get(f"{api_url}/v1/status", timeout=5)
+            if response.status_code == 200:
+                return jsonify({
+                    "available": True,
+                    "status": response.json(),
+                    "container_name": container_name,
+                    "node_id": node_id[:8]
+                })
+            else:
+                return jsonify({
+                    "available": False,
+                    "error": f"API returned status {response.status_code}",
+                    "error_type": "http_error",
+                    "container_name": container_name
+                })
+        except requests.exceptions.ConnectionError as e:
+            error_msg = str(e)
+            if "Failed to resolve" in error_msg or "Name or service not known" in error_msg:
+                return jsonify({
+                    "available": False,
+                    "error": "Service not running",
+                    "error_type": "container_not_running",
+                    "message": "The governance API container is not currently active"
+                })
+            else:
+                return jsonify({
+                    "available": False,
+                    "error": "Connection failed",
+                    "error_type": "connection_error",
+                    "message": "Cannot connect to the governance API service"
+                })
+        except requests.exceptions.Timeout:
             return jsonify({
                 "available": False,
-                "error": "Service not running",
-                "error_type": "container_not_running",
-                "message": "The governance API container is not currently active"
+                "error": "Service timeout",
+                "error_type": "timeout",
+                "message": "The governance API service is not responding"
             })
-        else:
+        except requests.exceptions.RequestException as e:
             return jsonify({
                 "available": False,
-                "error": "Connection failed",
-                "error_type": "connection_error",
-                "message": "Cannot connect to the governance API service"
+                "error": str(e),
+                "error_type": "request_error"
             })
-    except requests.exceptions.Timeout:
-        return jsonify({
-            "available": False,
-            "error": "Service timeout",
-            "error_type": "timeout",
-            "message": "The governance API service is not responding"
-        })
-    except requests.exceptions.RequestException as e:
-        return jsonify({
-            "available": False,
-            "error": str(e),
-            "error_type": "request_error"
-        })
 
 @app.route("/ui/propose", methods=["POST"])
 def propose_change():
@@ -285,60 +323,54 @@ def propose_change():
                       method=request.method,
                       remote_addr=request.remote_addr):
         try:
-        data = request.json
-        token = data.get("token")
-        content_text = data.get("content", "")
-        description = data.get("description", "Shortlist update via Admin UI")
+            data = request.json
+            token = data.get("token")
+            content_text = data.get("content", "")
+            description = data.get("description", "Shortlist update via Admin UI")
 
-        if not token:
-            return jsonify({"error": "API token is required"}), 400
+            if not token:
+                return jsonify({"error": "API token is required"}), 400
 
-        # Parse content
-        try:
-            items = parse_items_from_text(content_text)
-        except Exception as e:
-            return jsonify({"error": f"Invalid content format: {str(e)}"}), 400
+            # Parse content
+            try:
+                items = parse_items_from_text(content_text)
+            except Exception as e:
+                return jsonify({"error": f"Invalid content format: {str(e)}"}), 400
 
-        # Get dynamic API URL
-        assignments = read_json_file(ASSIGNMENTS_FILE) or {"assignments": {}}
-        governance_assignment = assignments["assignments"].get("shortlist_governance_api")
+            # Get dynamic API URL
+            api_url = _resolve_governance_api_url()
+            if not api_url:
+                return jsonify({"error": "Governance API not available"}), 503
 
-        if not governance_assignment:
-            return jsonify({"error": "Governance API not available"}), 503
+            # Prepare request to governance API
+            headers = {"Authorization": f"Bearer {token}"}
+            payload = {
+                "items": items,
+                "description": description
+            }
 
-        node_id = governance_assignment["node_id"]
-        container_name = f"shortlist_governance_api-{node_id[:8]}"
-        api_url = f"http://{container_name}:8000"
+            response = SESSION.post(
+                f"{api_url}/v1/proposals/shortlist",
+                json=payload,
+                headers=headers,
+                timeout=30
+            )
 
-        # Prepare request to governance API
-        headers = {"Authorization": f"Bearer {token}"}
-        payload = {
-            "items": items,
-            "description": description
-        }
-
-        response = requests.post(
-            f"{api_url}/v1/proposals/shortlist",
-            json=payload,
-            headers=headers,
-            timeout=30
-        )
-
-        return jsonify(response.json()), response.status_code
-
-    except requests.exceptions.RequestException as e:
-        error_detail = "Connection error to governance API"
-        if hasattr(e, 'response') and e.response is not None:
-            try:
-                error_detail = e.response.json()
-            except:
-                error_detail = e.response.text
-        return jsonify({"error": error_detail}), 503
-    except Exception as e:
-        logger.logger.error("Failed to propose change",
-                            error=str(e),
-                            error_type=type(e).__name__)
-        return jsonify({"error": str(e)}), 500
+            return jsonify(response.json()), response.status_code
+
+        except requests.exceptions.RequestException as e:
+            error_detail = "Connection error to governance API"
+            if hasattr(e, 'response') and e.response is not None:
+                try:
+                    error_detail = e.response.json()
+                except:
+                    error_detail = e.response.text
+            return jsonify({"error": error_detail}), 503
+        except Exception as e:
+            logger.logger.error("Failed to propose change",
+                                error=str(e),
+                                error_type=type(e).__name__)
+            return jsonify({"error": str(e)}), 500
 
 @app.route("/ui/apply", methods=["POST"])
 def apply_change():
@@ -348,56 +380,50 @@ def apply_change():
                       method=request.method,
                       remote_addr=request.remote_addr):
         try:
-        data = request.json
-        token = data.get("token")
-        content_text = data.get("content", "")
-
-        if not token:
-            return jsonify({"error": "API token is required"}), 400
-
-        # Parse content
-        try:
-            items = parse_items_from_text(content_text)
-        except Exception as e:
-            return jsonify({"error": f"Invalid content format: {str(e)}"}), 400
+            data = request.json
+            token = data.get("token")
+            content_text = data.get("content", "")
 
-        # Get dynamic API URL
-        assignments = read_json_file(ASSIGNMENTS_FILE) or {"assignments": {}}
-        governance_assignment = assignments["assignments"].get("shortlist_governance_api")
+            if not token:
+                return jsonify({"error": "API token is required"}), 400
 
-        if not governance_assignment:
-            return jsonify({"error": "Governance API not available"}), 503
+            # Parse content
+            try:
+                items = parse_items_from_text(content_text)
+            except Exception as e:
+                return jsonify({"error": f"Invalid content format: {str(e)}"}), 400
 
-        node_id = governance_assignment["node_id"]
-        container_name = f"shortlist_governance_api-{node_id[:8]}"
-        api_url = f"http://{container_name}:8000"
+            # Get dynamic API URL
+            api_url = _resolve_governance_api_url()
+            if not api_url:
+                return jsonify({"error": "Governance API not available"}), 503
 
-        # Prepare request to governance API
-        headers = {"Authorization": f"Bearer {token}"}
-        payload = {"items": items}
+            # Prepare request to governance API
+            headers = {"Authorization": f"Bearer {token}"}
+            payload = {"items": items}
 
-        response = requests.post(
-            f"{api_url}/v1/admin/shortlist",
-            json=payload,
-            headers=headers,
-            timeout=30
-        )
+            response = SESSION.post(
+                f"{api_url}/v1/admin/shortlist",
+                json=payload,
+                headers=headers,
+                timeout=30
+            )
 
-        return jsonify(response.json()), response.status_code
+            return jsonify(response.json()), response.status_code
 
-    except requests.exceptions.RequestException as e:
-        error_detail = "Connection error to governance API"
-        if hasattr(e, 'response') and e.response is not None:
-            try:
-                error_detail = e.response.json()
-            except:
-                error_detail = e.response.text
-        return jsonify({"error": error_detail}), 503
-    except Exception as e:
-        logger.logger.error("Failed to apply change",
-                            error=str(e),
-                            error_type=type(e).__name__)
-        return jsonify({"error": str(e)}), 500
+        except requests.exceptions.RequestException as e:
+            error_detail = "Connection error to governance API"
+            if hasattr(e, 'response') and e.response is not None:
+                try:
+                    error_detail = e.response.json()
+                except:
+                    error_detail = e.response.text
+            return jsonify({"error": error_detail}), 503
+        except Exception as e:
+            logger.logger.error("Failed to apply change",
+                                error=str(e),
+                                error_type=type(e).__name__)
+            return jsonify({"error": str(e)}), 500
 
 @app.route("/health")
 def health_check():
@@ -406,10 +432,10 @@ def health_check():
                       path=request.path,
                       remote_addr=request.remote_addr):
         return jsonify({
-        "status": "healthy",
-        "timestamp": datetime.utcnow().replace(tzinfo=timezone.utc).isoformat(),
-        "service": "shortlist-admin-ui"
-    })
+            "status": "healthy",
+            "timestamp": datetime.utcnow().replace(tzinfo=timezone.utc).isoformat(),
+            "service": "shortlist-admin-ui"
+        })
 
 
 # --- New proxy endpoints for History & Revert ---
@@ -432,7 +458,7 @@ def proxy_history():
                 return jsonify({"error": "Governance API not available"}), 503
 
             headers = {"Authorization": f"Bearer {token}"}
-            resp = requests.get(f"{api_url}/v1/admin/history", headers=headers, timeout=20)
+            resp = SESSION.get(f"{api_url}/v1/admin/history", headers=headers, timeout=20)
             return Response(resp.content, status=resp.status_code, mimetype=resp.headers.get('Content-Type', 'application/json'))
         except requests.exceptions.RequestException as e:
             return jsonify({"error": str(e)}), 503
@@ -466,7 +492,7 @@ def proxy_revert():
 
             headers = {"Authorization": f"Bearer {token}"}
             payload = {"commit_hash": commit_hash}
-            resp = requests.post(f"{api_url}/v1/admin/revert", json=payload, headers=headers, timeout=60)
+            resp = SESSION.post(f"{api_url}/v1/admin/revert", json=payload, headers=headers, timeout=60)
             return Response(resp.content, status=resp.status_code, mimetype=resp.headers.get('Content-Type', 'application/json'))
         except requests.exceptions.RequestException as e:
             return jsonify({"error": str(e)}), 503
@@ -489,7 +515,7 @@ def proxy_list_secrets():
             if not api_url:
                 return jsonify({"error": "Governance API not available"}), 503
             headers = {"Authorization": f"Bearer {token}"}
-            r = requests.get(f"{api_url}/v1/admin/secrets", headers=headers, timeout=20)
+            r = SESSION.get(f"{api_url}/v1/admin/secrets", headers=headers, timeout=20)
             return Response(r.content, status=r.status_code, mimetype=r.headers.get('Content-Type', 'application/json'))
         except requests.exceptions.RequestException as e:
             return jsonify({"error": str(e)}), 503
@@ -515,10 +541,10 @@ def proxy_mutate_secrets():
             headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
             if request.method == 'POST':
                 payload = {"key": data.get("key", ""), "value": data.get("value", "")}
-                r = requests.post(f"{api_url}/v1/admin/secrets", json=payload, headers=headers, timeout=20)
+                r = SESSION.post(f"{api_url}/v1/admin/secrets", json=payload, headers=headers, timeout=20)
             else:
                 payload = {"key": data.get("key", "")}
-                r = requests.delete(f"{api_url}/v1/admin/secrets", json=payload, headers=headers, timeout=20)
+                r = SESSION.delete(f"{api_url}/v1/admin/secrets", json=payload, headers=headers, timeout=20)
             return Response(r.content, status=r.status_code, mimetype=r.headers.get('Content-Type', 'application/json'))
         except requests.exceptions.RequestException as e:
             return jsonify({"error": str(e)}), 503
@@ -553,7 +579,7 @@ def proxy_preview():
 
             headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
             # Stream the response from the API to the client
-            with requests.post(f"{api_url}/v1/admin/preview", json={
+            with SESSION.post(f"{api_url}/v1/admin/preview", json={
                 "renderer_type": renderer_type,
                 "content": content
             }, headers=headers, stream=True, timeout=600) as r:
@@ -100,7 +100,10 @@ def read_json_file(file_path: str) -> Optional[Dict[str, Any]]:
 
 @log_execution_time(logger.logger)
 def write_json_file(file_path: str, data: Dict[str, Any]) -> None:
-    """Write data to a JSON file.
+    """Atomically replace a JSON file.
+    
+    The data goes to a temp file that is moved into place with os.replace, so
+    nodes reading the shared checkout never see a half-written file.
     
     Args:
         file_path: Path to the JSON file
@@ -108,13 +111,17 @@ def write_json_file(file_path: str, data: Dict[str, Any]) -> None:
     """
     with log_operation(logger.logger, "write_json", filepath=file_path):
         try:
-            with open(file_path, 'w') as f:
+            tmp_path = f"{file_path}.tmp.{os.getpid()}"
+            with open(tmp_path, 'w') as f:
                 json.dump(data, f, indent=2)
+            os.replace(tmp_path, file_path)
             logger.logger.info("Successfully wrote JSON file")
         except Exception as e:
             logger.logger.error("Failed to write JSON file",
                               error=str(e),
                               error_type=type(e).__name__)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
             raise
 
 def main() -> None:
@@ -126,61 +133,61 @@ def main() -> None:
             try:
                 git_pull_rebase()
 
-            roster = read_json_file("roster.json")
-            assignments = read_json_file("assignments.json")
-
-            if not all([roster, assignments]):
-                logger.logger.error("Failed to read required files",
-                                  roster_exists=bool(roster),
-                                  assignments_exists=bool(assignments))
-                time.sleep(HEALER_LOOP_INTERVAL_SECONDS)
-                continue
-
-            alive_node_ids = set()
-            now = datetime.utcnow()
-            for node_id, node_data in roster.get("nodes", {}).items():
-                last_seen_str = node_data.get("last_seen")
-                if last_seen_str:
-                    last_seen = date_parse(last_seen_str)
-                    if now - last_seen < timedelta(minutes=NODE_HEARTBEAT_TIMEOUT_MINUTES):
-                        alive_node_ids.add(node_id)
-
-            original_assignments_str = json.dumps(assignments, indent=2)
-            modified_assignments = json.loads(original_assignments_str) # Deep copy
-            assignments_changed = False
-            zombie_count = 0
-
-            tasks_to_keep = []
-            for task_id, assignment_data in modified_assignments.get("tasks", {}).items():
-                assigned_node_id = assignment_data.get("node_id")
-                if assigned_node_id and assigned_node_id not in alive_node_ids:
-                    logger.logger.warning("Detected zombie assignment",
-                                         task_id=task_id,
-                                         dead_node_id=assigned_node_id)
-                    zombie_count += 1
-                else:
-                    tasks_to_keep.append((task_id, assignment_data))
+                roster = read_json_file("roster.json")
+                assignments = read_json_file("assignments.json")
+
+                if not all([roster, assignments]):
+                    logger.logger.error("Failed to read required files",
+                                      roster_exists=bool(roster),
+                                      assignments_exists=bool(assignments))
+                    time.sleep(HEALER_LOOP_INTERVAL_SECONDS)
+                    continue
+
+                alive_node_ids = set()
+                now = datetime.utcnow()
+                for node_id, node_data in roster.get("nodes", {}).items():
+                    last_seen_str = node_data.get("last_seen")
+                    if last_seen_str:
+                        last_seen = date_parse(last_seen_str)
+                        if now - last_seen < timedelta(minutes=NODE_HEARTBEAT_TIMEOUT_MINUTES):
+                            alive_node_ids.add(node_id)
+
+                original_assignments_str = json.dumps(assignments, indent=2)
+                modified_assignments = json.loads(original_assignments_str) # Deep copy
+                assignments_changed = False
+                zombie_count = 0
+
+                tasks_to_keep = []
+                for task_id, assignment_data in modified_assignments.get("tasks", {}).items():
+                    assigned_node_id = assignment_data.get("node_id")
+                    if assigned_node_id and assigned_node_id not in alive_node_ids:
+                        logger.logger.warning("Detected zombie assignment",
+                                             task_id=task_id,
+                                             dead_node_id=assigned_node_id)
+                        zombie_count += 1
+                    else:
+                        tasks_to_keep.append((task_id, assignment_data))
             
-            if zombie_count > 0:
-                modified_assignments["tasks"] = {task_id: data for task_id, data in tasks_to_keep}
-                assignments_changed = True
-                logger.logger.info("Cleared zombie assignments",
-                                  zombie_count=zombie_count)
-
-            if assignments_changed:
-                logger.logger.info("Assignments modified",
-                                  remaining_tasks=len(tasks_to_keep))
-                write_json_file("assignments.json", modified_assignments)
-                git_commit_push(f"fix(healer): Cleared {zombie_count} zombie task assignments")
-            else:
-                logger.logger.info("No zombie assignments",
-                                  total_tasks=len(modified_assignments.get("tasks", {})))
-
-        except Exception as e:
-            logger.logger.error("Error in healer cycle",
-                              error=str(e),
-                              error_type=type(e).__name__,
-                              exc_info=True)
+                if zombie_count > 0:
+                    modified_assignments["tasks"] = {task_id: data for task_id, data in tasks_to_keep}
+                    assignments_changed = True
+                    logger.logger.info("Cleared zombie assignments",
+                                      zombie_count=zombie_count)
+
+                if assignments_changed:
+                    logger.logger.info("Assignments modified",
+                                      remaining_tasks=len(tasks_to_keep))
+                    write_json_file("assignments.json", modified_assignments)
+                    git_commit_push(f"fix(healer): Cleared {zombie_count} zombie task assignments")
+                else:
+                    logger.logger.info("No zombie assignments",
+                                      total_tasks=len(modified_assignments.get("tasks", {})))
+
+            except Exception as e:
+                logger.logger.error("Error in healer cycle",
+                                  error=str(e),
+                                  error_type=type(e).__name__,
+                                  exc_info=True)
 
         time.sleep(HEALER_LOOP_INTERVAL_SECONDS)
 
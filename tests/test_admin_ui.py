@@ -0,0 +1,99 @@
+import importlib.util
+import json
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from test_utils import BASE_DATETIME, REPO_ROOT
+
+pytest.importorskip("flask")
+
+ADMIN_UI_MAIN = REPO_ROOT / "renderers" / "admin_ui" / "main.py"
+
+
+class FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return BASE_DATETIME
+
+
+@pytest.fixture(scope="module")
+def admin_ui():
+    # The renderer logs to /app/data inside its container
+    with patch("utils.logging_config.configure_logging"):
+        spec = importlib.util.spec_from_file_location("admin_ui_main", ADMIN_UI_MAIN)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def swarm_status(admin_ui, tmp_path):
+    def get(roster, assignments):
+        roster_file = tmp_path / "roster.json"
+        assignments_file = tmp_path / "assignments.json"
+        roster_file.write_text(json.dumps(roster))
+        assignments_file.write_text(json.dumps(assignments))
+        with (patch.object(admin_ui, "ROSTER_FILE", str(roster_file)),
+              patch.object(admin_ui, "ASSIGNMENTS_FILE", str(assignments_file)),
+              patch.object(admin_ui, "SHORTLIST_FILE", str(tmp_path / "shortlist.json")),
+              patch.object(admin_ui, "datetime", FixedDatetime)):
+            response = admin_ui.app.test_client().get("/api/swarm-status")
+        assert response.status_code == 200
+        return response.get_json()
+    return get
+
+
+def _iso(age_seconds):
+    return (BASE_DATETIME - timedelta(seconds=age_seconds)).isoformat()
+
+
+def test_parse_iso_ts_accepts_z_suffix(admin_ui):
+    assert admin_ui._parse_iso_ts("2025-01-01T12:00:00Z") == BASE_DATETIME.timestamp()
+
+
+def test_parse_iso_ts_accepts_offsets(admin_ui):
+    assert admin_ui._parse_iso_ts("2025-01-01T14:00:00+02:00") == BASE_DATETIME.timestamp()
+    assert admin_ui._parse_iso_ts("2025-01-01T12:00:00.250000+00:00") == BASE_DATETIME.timestamp() + 0.25
+
+
+def test_parse_iso_ts_rejects_malformed(admin_ui):
+    with pytest.raises(ValueError):
+        admin_ui._parse_iso_ts("yesterday")
+
+
+def test_node_alive_cutoff_boundary(swarm_status):
+    roster = {"nodes": [
+        {"id": "node-alive-0001", "last_seen": _iso(299)},
+        {"id": "node-cutoff-0002", "last_seen": _iso(300)},
+        {"id": "node-stale-0003", "last_seen": _iso(301)},
+    ]}
+    status = swarm_status(roster, {"assignments": {}})
+
+    alive = {node["full_id"]: node["is_alive"] for node in status["nodes"]}
+    assert alive == {"node-alive-0001": True, "node-cutoff-0002": False, "node-stale-0003": False}
+    assert status["stats"]["alive_nodes"] == 1
+
+
+def test_task_healthy_cutoff_boundary(swarm_status):
+    now_ms = int(BASE_DATETIME.timestamp() * 1000)
+    assignments = {"assignments": {
+        "healthy": {"node_id": "node-0001", "task_heartbeat": _iso(119)},
+        "cutoff": {"node_id": "node-0002", "task_heartbeat": _iso(120)},
+        "healthy_ms": {"node_id": "node-0003", "task_heartbeat": _iso(500),
+                       "task_heartbeat_ms": now_ms - 119_000},
+        "stale_ms": {"node_id": "node-0004", "task_heartbeat": _iso(0),
+                     "task_heartbeat_ms": now_ms - 121_000},
+    }}
+    status = swarm_status({"nodes": []}, assignments)
+
+    healthy = {task["task_id"]: task["is_healthy"] for task in status["tasks"]}
+    assert healthy == {"healthy": True, "cutoff": False, "healthy_ms": True, "stale_ms": False}
+    assert status["stats"]["healthy_tasks"] == 2
+
+
+def test_governance_session_does_not_retry_connect_errors(admin_ui):
+    retries = admin_ui.SESSION.get_adapter("http://shortlist_governance_api:8000").max_retries
+    assert retries.connect == 0
+    assert retries.total == 2
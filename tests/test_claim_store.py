@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+import pytest
+
+from test_utils import BASE_DATETIME
+from utils.claim_store import ClaimStore
+
+EXPIRATION = timedelta(seconds=60)
+
+
+@pytest.fixture
+def store(tmp_path):
+    claim_store = ClaimStore(str(tmp_path / "claims.db"))
+    yield claim_store
+    claim_store.close()
+
+
+def _holder(store, task_id):
+    row = store.conn.execute("SELECT node_id FROM assignments WHERE task_id = ?", (task_id,)).fetchone()
+    return row[0] if row else None
+
+
+def test_claim_free_task(store):
+    assert store.claim("task1", "node-a", BASE_DATETIME, EXPIRATION)
+    assert _holder(store, "task1") == "node-a"
+
+
+def test_claim_is_reentrant_for_owner(store):
+    assert store.claim("task1", "node-a", BASE_DATETIME, EXPIRATION)
+    assert store.claim("task1", "node-a", BASE_DATETIME + timedelta(seconds=5), EXPIRATION)
+
+
+def test_claim_refuses_live_claim(store):
+    assert store.claim("task1", "node-a", BASE_DATETIME, EXPIRATION)
+    assert not store.claim("task1", "node-b", BASE_DATETIME + EXPIRATION - timedelta(seconds=1), EXPIRATION)
+    assert _holder(store, "task1") == "node-a"
+
+
+def test_claim_steals_expired_claim(store):
+    assert store.claim("task1", "node-a", BASE_DATETIME, EXPIRATION)
+    assert store.claim("task1", "node-b", BASE_DATETIME + EXPIRATION + timedelta(seconds=1), EXPIRATION)
+    assert _holder(store, "task1") == "node-b"
+
+
+def test_heartbeat_keeps_claim_alive(store):
+    assert store.claim("task1", "node-a", BASE_DATETIME, EXPIRATION)
+    assert store.heartbeat("task1", "node-a", BASE_DATETIME + timedelta(seconds=50))
+    assert not store.claim("task1", "node-b", BASE_DATETIME + timedelta(seconds=70), EXPIRATION)
+
+
+def test_heartbeat_from_non_owner_fails(store):
+    assert store.claim("task1", "node-a", BASE_DATETIME, EXPIRATION)
+    assert not store.heartbeat("task1", "node-b", BASE_DATETIME + timedelta(seconds=5))
+    assert not store.heartbeat("unknown-task", "node-a", BASE_DATETIME + timedelta(seconds=5))
+
+
+def test_heartbeat_after_takeover_fails(store):
+    assert store.claim("task1", "node-a", BASE_DATETIME, EXPIRATION)
+    assert store.claim("task1", "node-b", BASE_DATETIME + EXPIRATION * 2, EXPIRATION)
+    assert not store.heartbeat("task1", "node-a", BASE_DATETIME + EXPIRATION * 2)
+
+
+def test_release_only_drops_own_claim(store):
+    assert store.claim("task1", "node-a", BASE_DATETIME, EXPIRATION)
+    store.release("task1", "node-b")
+    assert _holder(store, "task1") == "node-a"
+    store.release("task1", "node-a")
+    assert _holder(store, "task1") is None
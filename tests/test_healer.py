@@ -0,0 +1,42 @@
+import importlib.util
+import json
+from unittest.mock import patch
+
+import pytest
+
+from test_utils import REPO_ROOT
+
+pytest.importorskip("dateutil")
+
+HEALER_MAIN = REPO_ROOT / "renderers" / "healer" / "main.py"
+
+
+@pytest.fixture(scope="module")
+def healer():
+    # The renderer logs to /app/data inside its container
+    with patch("utils.logging_config.configure_logging"):
+        spec = importlib.util.spec_from_file_location("healer_main", HEALER_MAIN)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+
+def test_write_json_file_replaces_atomically(healer, tmp_path):
+    path = tmp_path / "assignments.json"
+    path.write_text('{"tasks": {"old": {}}}')
+
+    healer.write_json_file(str(path), {"tasks": {}})
+
+    assert json.loads(path.read_text()) == {"tasks": {}}
+    assert [p.name for p in tmp_path.iterdir()] == ["assignments.json"]
+
+
+def test_write_json_file_failure_keeps_original(healer, tmp_path):
+    path = tmp_path / "assignments.json"
+    path.write_text('{"tasks": {"old": {}}}')
+
+    with pytest.raises(TypeError):
+        healer.write_json_file(str(path), {"tasks": {"bad": object()}})
+
+    assert json.loads(path.read_text()) == {"tasks": {"old": {}}}
+    assert [p.name for p in tmp_path.iterdir()] == ["assignments.json"]
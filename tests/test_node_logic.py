@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import patch, mock_open, MagicMock
 import json
 import subprocess
+import threading
 from datetime import datetime, timedelta, timezone
 
 # Import the Node class and other relevant functions from node.py
@@ -186,6 +187,27 @@ def test_read_json_file_decode_error(mock_json_file_operations):
     result = Node.read_json_file("malformed.json")
     assert result is None
 
+def test_write_json_file_persists_in_place_mutation(tmp_path):
+    from node import read_json_file, write_json_file
+    path = str(tmp_path / "assignments.json")
+    write_json_file(path, {"assignments": {"task1": {"node_id": "node-a"}}})
+
+    # Callers such as RegionalCoordinator edit the cached dict before writing it back
+    data = read_json_file(path)
+    del data["assignments"]["task1"]
+    write_json_file(path, data)
+
+    with open(path) as f:
+        assert json.load(f) == {"assignments": {}}
+
+def test_write_json_file_skips_unchanged_content(tmp_path):
+    from node import write_json_file
+    path = str(tmp_path / "roster.json")
+    write_json_file(path, {"nodes": []})
+    with patch('node.os.replace') as mock_replace:
+        write_json_file(path, {"nodes": []})
+        mock_replace.assert_not_called()
+
 # --- Test Cases for perform_roster_heartbeat ---
 
 def test_perform_roster_heartbeat_new_node(mock_node_id_file, mock_git_commands, mock_json_file_operations, mock_datetime):
@@ -356,3 +378,281 @@ def test_active_state_lost_assignment(mock_node_id_file, mock_git_commands, mock
     # Verify state transition
     assert node.state == NodeState.IDLE
     assert node.current_task is None
+
+# --- Test Cases for _find_candidate_task ---
+
+NOW_MS = int(datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc).timestamp() * 1000)
+
+def _find_candidate(tasks, assignments):
+    # The scan only reads the state files, so no node needs to be started
+    node = Node.__new__(Node)
+    with (patch('node.read_json_file', side_effect=[{"tasks": tasks}, {"assignments": assignments}]),
+          patch('node.time.time', return_value=NOW_MS / 1000)):
+        return node._find_candidate_task()
+
+def _assignment(age):
+    return {"node_id": "other-node", "task_heartbeat_ms": NOW_MS - int(age.total_seconds() * 1000)}
+
+def test_find_candidate_task_lowest_priority_number_wins():
+    tasks = [{"id": "low", "priority": 5}, {"id": "high", "priority": 1}, {"id": "mid", "priority": 3}]
+    assert _find_candidate(tasks, {})["id"] == "high"
+
+def test_find_candidate_task_tie_keeps_schedule_order():
+    tasks = [{"id": "first", "priority": 2}, {"id": "second", "priority": 2}, {"id": "unprioritized"}]
+    assert _find_candidate(tasks, {})["id"] == "first"
+
+def test_find_candidate_task_skips_live_assignment():
+    tasks = [{"id": "taken", "priority": 1}, {"id": "free", "priority": 2}]
+    assignments = {"taken": _assignment(TASK_EXPIRATION - timedelta(seconds=1))}
+    assert _find_candidate(tasks, assignments)["id"] == "free"
+
+def test_find_candidate_task_prefers_orphaned_over_lower_priority_free():
+    tasks = [{"id": "free", "priority": 2}, {"id": "orphaned", "priority": 1}]
+    assignments = {"orphaned": _assignment(TASK_EXPIRATION + timedelta(seconds=1))}
+    assert _find_candidate(tasks, assignments)["id"] == "orphaned"
+
+def test_find_candidate_task_none_when_all_assigned():
+    tasks = [{"id": "task1", "priority": 1}]
+    assert _find_candidate(tasks, {"task1": _assignment(timedelta(seconds=5))}) is None
+    assert _find_candidate([], {}) is None
+
+# --- Test Cases for heartbeat_ms ---
+
+def test_heartbeat_ms_prefers_epoch_milliseconds():
+    from node import heartbeat_ms
+    assignment = {"task_heartbeat_ms": 1735732800123, "task_heartbeat": "2000-01-01T00:00:00+00:00"}
+    assert heartbeat_ms(assignment) == 1735732800123
+
+def test_heartbeat_ms_falls_back_to_iso_timestamp():
+    from node import heartbeat_ms
+    assert heartbeat_ms({"task_heartbeat": "2025-01-01T12:00:00.5+00:00"}) == 1735732800500
+    assert heartbeat_ms({"task_heartbeat": "2025-01-01T13:00:00+01:00"}) == 1735732800000
+
+@pytest.mark.parametrize("assignment", [
+    {},
+    {"task_heartbeat": "not-a-timestamp"},
+    {"task_heartbeat": None},
+    {"task_heartbeat_ms": "1735732800000"},
+])
+def test_heartbeat_ms_treats_missing_or_malformed_as_epoch(assignment):
+    from node import heartbeat_ms
+    assert heartbeat_ms(assignment) == 0
+
+# --- Test Cases for hash_build_context ---
+
+def test_hash_build_context_frames_paths_and_contents(tmp_path):
+    from node import hash_build_context
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    # Same concatenation of path and content bytes, split differently
+    (first / "ab").write_bytes(b"c")
+    (second / "a").write_bytes(b"bc")
+    assert hash_build_context(str(first)) != hash_build_context(str(second))
+
+def test_hash_build_context_rereads_only_changed_files(tmp_path):
+    from node import hash_build_context
+    (tmp_path / "Dockerfile").write_text("FROM python:3.11-slim\n")
+    (tmp_path / "main.py").write_text("print('v1')\n")
+    original = hash_build_context(str(tmp_path))
+
+    with patch('builtins.open', side_effect=AssertionError("unchanged file reread")):
+        assert hash_build_context(str(tmp_path)) == original
+
+    (tmp_path / "main.py").write_text("print('version 2')\n")
+    assert hash_build_context(str(tmp_path)) != original
+
+# --- Test Cases for git_is_at ---
+
+@pytest.fixture
+def cloned_repo(tmp_path, monkeypatch):
+    def git(*args, cwd):
+        subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True)
+
+    origin, clone = tmp_path / "origin", tmp_path / "clone"
+    git('init', '--quiet', '--bare', '--initial-branch=main', str(origin), cwd=tmp_path)
+    git('clone', '--quiet', str(origin), str(clone), cwd=tmp_path)
+    git('config', 'user.name', 'test', cwd=clone)
+    git('config', 'user.email', 'test@example.com', cwd=clone)
+    (clone / "assignments.json").write_text('{"assignments": {}}\n')
+    git('add', 'assignments.json', cwd=clone)
+    git('commit', '--quiet', '-m', 'init', cwd=clone)
+    git('push', '--quiet', 'origin', 'HEAD:main', cwd=clone)
+    git('fetch', '--quiet', 'origin', cwd=clone)
+
+    monkeypatch.chdir(clone)
+    monkeypatch.setattr('node._repo', None)
+    return clone, lambda *args: git(*args, cwd=clone)
+
+@pytest.mark.parametrize("in_process", [True, False])
+def test_git_is_at_detects_local_changes(cloned_repo, monkeypatch, in_process):
+    from node import git_is_at
+    clone, git = cloned_repo
+    monkeypatch.setattr('node.in_process_checkout', lambda: in_process)
+
+    assert git_is_at('origin/main')
+
+    # Untracked files survive a hard reset, so they do not count
+    (clone / "scratch.txt").write_text("untracked\n")
+    assert git_is_at('origin/main')
+
+    (clone / "assignments.json").write_text('{"assignments": {"task1": {}}}\n')
+    assert not git_is_at('origin/main')
+
+    git('commit', '--quiet', '-am', 'local claim')
+    assert not git_is_at('origin/main')
+
+# --- Test Cases for _task_heartbeat_loop ---
+
+def _heartbeat_node():
+    node = Node.__new__(Node)
+    node.node_id = "test-node-id"
+    node.logger = MagicMock()
+    node.claim_store = None
+    node.last_roster_heartbeat = datetime.now(timezone.utc)  # No roster heartbeat due
+    return node
+
+def _run_heartbeat_loop(node, commit_side_effect, assignments=None):
+    stop_event, task_lost = threading.Event(), threading.Event()
+    assignments = assignments or {"assignments": {"task1": {"node_id": node.node_id}}}
+    with (patch('node.git_pull'),
+          patch('node.read_json_file', return_value=assignments),
+          patch('node.write_json_file'),
+          patch('node.commit_and_push', side_effect=commit_side_effect(stop_event)) as mock_commit,
+          patch('node.git_reset_hard') as mock_reset,
+          patch('node.TASK_HEARTBEAT_INTERVAL', timedelta(0))):
+        node._task_heartbeat_loop("task1", stop_event, task_lost)
+    return task_lost, mock_commit, mock_reset
+
+def test_task_heartbeat_push_rejection_resets_and_retries():
+    def commit_side_effect(stop_event):
+        def commit(files, message):
+            if commit.calls == 0:
+                commit.calls += 1
+                raise subprocess.CalledProcessError(1, ['git', 'push'], stderr="rejected")
+            stop_event.set()
+        commit.calls = 0
+        return commit
+
+    task_lost, mock_commit, mock_reset = _run_heartbeat_loop(_heartbeat_node(), commit_side_effect)
+
+    assert not task_lost.is_set()
+    assert mock_commit.call_count == 2
+    mock_reset.assert_called_once_with('@{upstream}')
+
+def test_task_heartbeat_stops_when_assignment_taken_over():
+    assignments = {"assignments": {"task1": {"node_id": "another-node"}}}
+    task_lost, mock_commit, _ = _run_heartbeat_loop(_heartbeat_node(), lambda stop_event: None, assignments)
+
+    assert task_lost.is_set()
+    mock_commit.assert_not_called()
+
+def test_task_heartbeat_single_failed_push_keeps_task():
+    def commit_side_effect(stop_event):
+        results = iter([RuntimeError("push failed"), None, None])
+        def commit(files, message):
+            result = next(results)
+            if result is not None:
+                raise result
+            if commit.succeeded:
+                stop_event.set()
+            commit.succeeded = True
+        commit.succeeded = False
+        return commit
+
+    task_lost, mock_commit, _ = _run_heartbeat_loop(_heartbeat_node(), commit_side_effect)
+
+    assert not task_lost.is_set()
+    assert mock_commit.call_count == 3
+
+def test_task_heartbeat_gives_up_before_expiration():
+    def commit_side_effect(stop_event):
+        return subprocess.CalledProcessError(1, ['git', 'push'])
+
+    with patch('node.TASK_HEARTBEAT_GIVE_UP', timedelta(milliseconds=50)):
+        task_lost, mock_commit, mock_reset = _run_heartbeat_loop(_heartbeat_node(), commit_side_effect)
+
+    assert task_lost.is_set()
+    assert mock_commit.call_count > 1  # Several failures were tolerated first
+    assert mock_reset.call_count == mock_commit.call_count
+
+# --- Test Cases for _sync_loop ---
+
+class _StopLoop(Exception):
+    pass
+
+def test_sync_loop_resets_after_failed_pull():
+    node = _heartbeat_node()
+    node.state = NodeState.IDLE
+    with (patch('node.git_pull', side_effect=subprocess.CalledProcessError(1, ['git', 'pull'])),
+          patch('node.git_reset_to_upstream') as mock_reset,
+          patch('node.time.sleep', side_effect=[None, _StopLoop])):
+        with pytest.raises(_StopLoop):
+            node._sync_loop()
+
+    mock_reset.assert_called_once()
+
+def test_git_reset_to_upstream_clears_conflicted_merge(cloned_repo, tmp_path, monkeypatch):
+    from node import git_reset_to_upstream, read_json_file
+    clone, git = cloned_repo
+    monkeypatch.setattr('node.in_process_checkout', lambda: False)
+
+    # Another node pushes a conflicting change to assignments.json
+    other = tmp_path / "other"
+    subprocess.run(['git', 'clone', '--quiet', str(tmp_path / "origin"), str(other)], check=True)
+    (other / "assignments.json").write_text('{"assignments": {"task1": {"node_id": "other"}}}\n')
+    for args in (['add', 'assignments.json'],
+                 ['-c', 'user.name=other', '-c', 'user.email=other@example.com', 'commit', '--quiet', '-m', 'other'],
+                 ['push', '--quiet', 'origin', 'HEAD:main']):
+        subprocess.run(['git', *args], cwd=other, check=True, capture_output=True)
+
+    (clone / "assignments.json").write_text('{"assignments": {"task1": {"node_id": "local"}}}\n')
+    git('commit', '--quiet', '-am', 'local')
+    with pytest.raises(subprocess.CalledProcessError):
+        subprocess.run(['git', 'pull', '--no-rebase', '--quiet'], cwd=clone, check=True, capture_output=True)
+    assert read_json_file(str(clone / "assignments.json")) is None  # Conflict markers
+
+    git_reset_to_upstream()
+
+    assert read_json_file(str(clone / "assignments.json")) == {"assignments": {"task1": {"node_id": "other"}}}
+    assert not (clone / ".git" / "MERGE_HEAD").exists()
+
+# --- Test Cases for _housekeeping_loop ---
+
+def test_housekeeping_retries_failed_roster_heartbeat_quickly():
+    node = _heartbeat_node()
+    node.last_roster_heartbeat = None
+
+    def heartbeat():
+        # Fails twice, then succeeds
+        heartbeat.calls += 1
+        if heartbeat.calls == 3:
+            node.last_roster_heartbeat = datetime.now(timezone.utc)
+    heartbeat.calls = 0
+    node.perform_roster_heartbeat = heartbeat
+
+    with (patch('node.time.sleep', side_effect=[None, None, _StopLoop]) as mock_sleep,
+          patch('node.random.uniform', return_value=0.0)):
+        with pytest.raises(_StopLoop):
+            node._housekeeping_loop()
+
+    waits = [c.args[0] for c in mock_sleep.call_args_list]
+    assert waits[:2] == [2.0, 4.0]
+    assert waits[2] == pytest.approx(HEARTBEAT_INTERVAL.total_seconds(), abs=1)
+
+def test_recover_and_reset_keeps_full_clone_history(cloned_repo):
+    clone, git = cloned_repo
+    git('commit', '--quiet', '--allow-empty', '-m', 'second')
+    git('push', '--quiet', 'origin', 'HEAD:main')
+    git('commit', '--quiet', '--allow-empty', '-m', 'unpushed')
+
+    node = _heartbeat_node()
+    node.state = NodeState.ACTIVE
+    node.current_task = {"id": "task1"}
+    node.recover_failures = 0
+    with patch('node.time.sleep'):
+        node._recover_and_reset("test")
+
+    assert not (clone / ".git" / "shallow").exists()
+    log = subprocess.run(['git', 'log', '--format=%s'], cwd=clone, capture_output=True, text=True).stdout
+    assert log.split() == ['second', 'init']
@@ -0,0 +1,200 @@
+import importlib
+import json
+import logging
+import sqlite3
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from test_utils import REPO_ROOT
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("feedparser")
+
+CURATOR_DIR = REPO_ROOT / "agents" / "rss_curator"
+FEED_URL = "https://example.com/feed.xml"
+
+RSS_BODY = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Example</title>
+<item><guid>article-1</guid><title>New AI release</title>
+<description>Something about AI</description></item>
+</channel></rss>"""
+
+
+@pytest.fixture
+def curator_module(tmp_path, monkeypatch):
+    # The module creates its log directory relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(CURATOR_DIR))
+    if "curator" in sys.modules:
+        return sys.modules["curator"]
+    return importlib.import_module("curator")
+
+
+@pytest.fixture
+def curator(curator_module, tmp_path, monkeypatch):
+    monkeypatch.setenv("TEST_CURATOR_TOKEN", "token")
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({
+        "api_endpoint": "http://localhost:8004/v1/proposals/shortlist",
+        "api_token_env_var": "TEST_CURATOR_TOKEN",
+        "feeds": [{"name": "Example", "url": FEED_URL, "keywords": ["AI"], "max_age_days": 7}],
+        "content_template": {"title": "{title}", "content": "{title}: {link}", "type": "text"},
+    }))
+    agent = curator_module.RSSCurator(str(config_path), str(tmp_path / "state.db"))
+    agent.session = MagicMock()
+    yield agent
+    agent.conn.close()
+
+
+def _saved_validators(agent):
+    return agent.conn.execute("SELECT url, etag, last_modified FROM feeds_state").fetchall()
+
+
+def test_run_once_skips_not_modified_feed(curator, curator_module, caplog):
+    caplog.set_level(logging.INFO, logger="rss_curator")
+    not_modified = curator_module.FetchedFeed(None, '"v1"', None)
+
+    with patch.object(curator, "_fetch_all", return_value=[not_modified]) as mock_fetch:
+        assert curator.run_once() == 0
+
+    mock_fetch.assert_called_once_with([FEED_URL])
+    curator.session.post.assert_not_called()
+    assert any("Feed not modified" in r.getMessage() and FEED_URL in r.getMessage()
+               for r in caplog.records)
+
+
+def test_run_once_saves_validators_after_successful_proposals(curator, curator_module):
+    curator.session.post.return_value = MagicMock(status_code=201)
+    fetched = curator_module.FetchedFeed(RSS_BODY, '"v1"', "Wed, 01 Jan 2025 12:00:00 GMT")
+
+    with (patch.object(curator, "_fetch_all", return_value=[fetched]),
+          patch.object(curator, "_is_article_recent", return_value=True)):
+        assert curator.run_once() == 1
+
+    assert _saved_validators(curator) == [(FEED_URL, '"v1"', "Wed, 01 Jan 2025 12:00:00 GMT")]
+
+
+def test_run_once_keeps_validators_when_a_proposal_fails(curator, curator_module):
+    curator.session.post.return_value = MagicMock(status_code=500, text="error")
+    fetched = curator_module.FetchedFeed(RSS_BODY, '"v1"', None)
+
+    with (patch.object(curator, "_fetch_all", return_value=[fetched]),
+          patch.object(curator, "_is_article_recent", return_value=True)):
+        assert curator.run_once() == 0
+
+    # The failed article must be downloaded again next cycle
+    assert _saved_validators(curator) == []
+
+
+def test_run_once_keeps_validators_when_filtering_raises(curator, curator_module):
+    fetched = curator_module.FetchedFeed(RSS_BODY, '"v1"', None)
+
+    with (patch.object(curator, "_fetch_all", return_value=[fetched]),
+          patch.object(curator, "_contains_keywords", side_effect=RuntimeError("boom"))):
+        assert curator.run_once() == 0
+
+    assert _saved_validators(curator) == []
+
+
+def _create_legacy_db(path, table="processed_articles", processed_at=True):
+    conn = sqlite3.connect(path)
+    columns = "id INTEGER PRIMARY KEY, guid TEXT UNIQUE, feed_name TEXT NOT NULL, title TEXT NOT NULL"
+    if processed_at:
+        columns += ", processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP"
+    with conn:
+        conn.execute(f"CREATE TABLE {table} ({columns})")
+        conn.execute(f"INSERT INTO {table} (guid, feed_name, title) VALUES ('old-1', 'Example', 'Old')")
+    return conn
+
+
+def _reopen(agent, db_path):
+    agent.conn.close()
+    agent.db_path = str(db_path)
+    agent.conn = sqlite3.connect(agent.db_path)
+
+
+def _table_sql(conn):
+    return dict(conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'table'").fetchall())
+
+
+def test_init_database_migrates_legacy_table(curator, tmp_path):
+    db_path = tmp_path / "legacy.db"
+    _create_legacy_db(db_path).close()
+
+    _reopen(curator, db_path)
+    curator._init_database()
+
+    tables = _table_sql(curator.conn)
+    assert "WITHOUT ROWID" in tables["processed_articles"].upper()
+    assert "processed_articles_old" not in tables
+    assert curator.conn.execute("SELECT guid FROM processed_articles").fetchall() == [("old-1",)]
+
+
+def test_init_database_recovers_leftover_old_table(curator, tmp_path):
+    db_path = tmp_path / "interrupted.db"
+    conn = _create_legacy_db(db_path, table="processed_articles_old")
+    with conn:
+        conn.execute("""
+            CREATE TABLE processed_articles (
+                guid TEXT PRIMARY KEY, feed_name TEXT NOT NULL, title TEXT NOT NULL,
+                processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            ) WITHOUT ROWID
+        """)
+        conn.execute("INSERT INTO processed_articles (guid, feed_name, title) VALUES ('new-1', 'Example', 'New')")
+    conn.close()
+
+    _reopen(curator, db_path)
+    curator._init_database()
+
+    assert "processed_articles_old" not in _table_sql(curator.conn)
+    assert sorted(curator.conn.execute("SELECT guid FROM processed_articles")) == [("new-1",), ("old-1",)]
+
+
+def test_init_database_rolls_back_failed_migration(curator, tmp_path):
+    # Without processed_at the copy step fails after the rename and CREATE
+    db_path = tmp_path / "broken.db"
+    _create_legacy_db(db_path, processed_at=False).close()
+
+    _reopen(curator, db_path)
+    with pytest.raises(Exception):
+        curator._init_database()
+
+    tables = _table_sql(curator.conn)
+    assert "WITHOUT ROWID" not in tables["processed_articles"].upper()
+    assert "processed_articles_old" not in tables
+    assert curator.conn.execute("SELECT guid FROM processed_articles").fetchall() == [("old-1",)]
+
+
+def test_filter_and_propose_batches_lookups_and_inserts(curator, curator_module):
+    total = curator_module.SQLITE_MAX_IN_PARAMS * 2 + 7
+    with curator.conn:
+        curator.conn.executemany(
+            "INSERT INTO processed_articles (guid, feed_name, title) VALUES (?, 'Example', 'Seen')",
+            [(f"guid-{i}",) for i in range(0, total, 3)]
+        )
+    entries = [{"id": f"guid-{i}", "title": f"AI story {i}"} for i in range(total)]
+    curator.session.post.return_value = MagicMock(status_code=201)
+
+    statements = []
+    curator.conn.set_trace_callback(statements.append)
+    with patch.object(curator, "_is_article_recent", return_value=True):
+        proposed, handled = curator._filter_and_propose(entries, curator.config["feeds"][0])
+    curator.conn.set_trace_callback(None)
+
+    expected_new = total - len(range(0, total, 3))
+    assert (proposed, handled) == (expected_new, True)
+    assert curator.session.post.call_count == expected_new
+
+    lookups = [s for s in statements if "SELECT guid FROM processed_articles" in s]
+    assert len(lookups) == 3
+    inserts = [s for s in statements if "INSERT OR IGNORE INTO processed_articles" in s]
+    assert len(inserts) == expected_new  # executemany traces each row
+    assert statements.count("BEGIN ") == 1  # ...but in a single transaction
+    assert curator.conn.execute("SELECT COUNT(*) FROM processed_articles").fetchone()[0] == total
+
+    # A second pass finds everything already processed
+    curator.session.post.reset_mock()
+    assert curator._filter_and_propose(entries, curator.config["feeds"][0]) == (0, True)
+    curator.session.post.assert_not_called()
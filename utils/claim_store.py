@@ -0,0 +1,94 @@
+"""
+Local task claim store for Shortlist.
+
+Nodes that run on the same host can arbitrate task claims through a shared
+SQLite database instead of racing each other with jittered git pushes. A
+claim is a single atomic upsert, so exactly one node wins a free or orphaned
+task. Git remains the durable, swarm-wide record of the assignment.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+class ClaimStore:
+    """Atomic task claims shared by the nodes of one host."""
+
+    def __init__(self, db_path: str):
+        """Open (and create if needed) the claim database.
+
+        Args:
+            db_path: Path to the SQLite database shared by local nodes
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        # Autocommit mode: every statement is its own atomic transaction
+        self.conn = sqlite3.connect(db_path, timeout=5.0, isolation_level=None,
+                                    check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS assignments (
+                task_id TEXT PRIMARY KEY,
+                node_id TEXT NOT NULL,
+                claimed_at REAL NOT NULL,
+                task_heartbeat REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+
+    def claim(self, task_id: str, node_id: str, now: datetime, expiration: timedelta) -> bool:
+        """Try to claim a task.
+
+        The claim succeeds if the task is unclaimed, already held by this
+        node, or its last heartbeat is older than ``expiration``.
+
+        Args:
+            task_id: ID of the task to claim
+            node_id: ID of the claiming node
+            now: Current UTC time
+            expiration: Age after which another node's claim is orphaned
+
+        Returns:
+            True if this node now holds the claim
+        """
+        now_ts = now.timestamp()
+        with self._lock:
+            cursor = self.conn.execute(
+                """
+                INSERT INTO assignments (task_id, node_id, claimed_at, task_heartbeat)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(task_id) DO UPDATE SET
+                    node_id = excluded.node_id,
+                    claimed_at = excluded.claimed_at,
+                    task_heartbeat = excluded.task_heartbeat
+                WHERE assignments.node_id = excluded.node_id
+                   OR assignments.task_heartbeat < ?
+                """,
+                (task_id, node_id, now_ts, now_ts, now_ts - expiration.total_seconds())
+            )
+            return cursor.rowcount == 1
+
+    def heartbeat(self, task_id: str, node_id: str, now: datetime) -> bool:
+        """Refresh the heartbeat of a claim held by this node.
+
+        Returns:
+            False if the claim is no longer held by ``node_id``
+        """
+        with self._lock:
+            cursor = self.conn.execute(
+                "UPDATE assignments SET task_heartbeat = ? WHERE task_id = ? AND node_id = ?",
+                (now.timestamp(), task_id, node_id)
+            )
+            return cursor.rowcount == 1
+
+    def release(self, task_id: str, node_id: str) -> None:
+        """Drop a claim held by this node (no-op if it was taken over)."""
+        with self._lock:
+            self.conn.execute(
+                "DELETE FROM assignments WHERE task_id = ? AND node_id = ?",
+                (task_id, node_id)
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
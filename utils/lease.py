@@ -124,7 +124,8 @@ def extend_lease(
     updated_task = task.copy()
     updated_task['lease_expires_at'] = create_lease(duration)
     
-    if 'task_heartbeat' in updated_task:
-        del updated_task['task_heartbeat']  # Remove old heartbeat field
+    # Remove old heartbeat fields
+    updated_task.pop('task_heartbeat', None)
+    updated_task.pop('task_heartbeat_ms', None)
         
     return updated_task
\ No newline at end of file